@@ -1,5 +1,6 @@
 """Common logging utilities."""
 
+import asyncio
 import time
 from functools import wraps
 
@@ -98,7 +99,6 @@ def log_function_call(operation_name: str | None = None, log_args: bool = False,
                 raise
 
         # Return appropriate wrapper based on whether function is async
-        import asyncio
         if asyncio.iscoroutinefunction(func):
             return async_wrapper
         else:
@@ -47,11 +47,13 @@ class RateLimitError(GitHubAPIError):
         message: str = "GitHub API rate limit exceeded",
         reset_time: int | None = None,
         remaining_requests: int | None = None,
+        retry_after: float | None = None,
         **kwargs,
     ) -> None:
         super().__init__(message, error_code="RATE_LIMIT_EXCEEDED", **kwargs)
         self.reset_time = reset_time
         self.remaining_requests = remaining_requests
+        self.retry_after = retry_after
 
 
 class AuthenticationError(GitHubAPIError):
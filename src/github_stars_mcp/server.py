@@ -8,6 +8,7 @@ sys.stdout = sys.stderr
 
 import structlog
 
+from . import shared
 from .config import settings
 from .shared import mcp
 
@@ -34,8 +35,6 @@ logger.info("GitHub Stars MCP Server module loaded", log_level=settings.log_leve
 # Async initialization function
 async def initialize_server():
     """Initialize server components asynchronously."""
-    from . import shared
-
     # Initialize GitHub client
     if settings.github_token:
         await shared.initialize_github_client()
@@ -59,6 +58,16 @@ except RuntimeError:
 def main() -> None:
     """Main entry point for the MCP server."""
 
+    # Use uvloop's C event loop when available; it is not supported on
+    # Windows, where the default asyncio loop is used instead.
+    try:
+        import uvloop
+
+        uvloop.install()
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        logger.debug("uvloop not available, using default event loop")
+
     try:
         logger.info(
             "Starting GitHub Stars MCP Server from main()", log_level=settings.log_level
@@ -72,6 +81,9 @@ def main() -> None:
     except Exception as e:
         logger.error("Server failed to start", error=str(e))
         sys.exit(1)
+    finally:
+        # Release the shared client's HTTP connection pool
+        asyncio.run(shared.shutdown_github_client())
 
 
 if __name__ == "__main__":
@@ -77,6 +77,7 @@ def _configure_logging():
 _configure_logging()
 
 
+from github_stars_mcp.config import settings
 from github_stars_mcp.utils.github_client import GitHubClient
 
 # FastMCP server instance
@@ -90,8 +91,6 @@ async def initialize_github_client():
     """Initialize GitHub client."""
     global github_client
     try:
-        from .config import settings
-
         logger = structlog.get_logger(__name__)
         github_client = GitHubClient(settings.github_token)
         logger.info("GitHub client initialized")
@@ -99,3 +98,11 @@ async def initialize_github_client():
         logger = structlog.get_logger(__name__)
         logger.error("Failed to initialize GitHub client", error=str(e))
         github_client = None
+
+
+async def shutdown_github_client():
+    """Close the GitHub client and its HTTP connection pool."""
+    global github_client
+    if github_client is not None:
+        await github_client.aclose()
+        github_client = None
@@ -1,6 +1,7 @@
 """High-level analysis bundle tool for GitHub starred repositories."""
 
 import asyncio
+import contextlib
 from asyncio import Semaphore
 from itertools import islice
 
@@ -49,21 +50,35 @@ async def _fetch_all_starred_repositories(ctx: Context, username: str | None, ma
     await ctx.info("Fetching starred repositories list")
     starred_data = await _get_user_starred_repositories_impl(ctx=ctx, username=username)
 
-    for repo in starred_data.repositories:
-        stated_repo_map[repo.repo_id] = StartedRepoWithReadme.model_construct(**repo.model_dump())
-
-    # Fetch additional pages if needed
-    while starred_data.has_next_page and len(stated_repo_map) < max_repositories:
-        await ctx.info(f"Fetching next page of starred repositories, current count: {len(stated_repo_map)}")
-        starred_data = await _get_user_starred_repositories_impl(
-            ctx=ctx, username=username, cursor=starred_data.end_cursor
-        )
+    # Cursors are opaque, so pages cannot be fetched fully in parallel;
+    # instead, prefetch the next page as soon as the current cursor is
+    # known so network time overlaps local processing of the page.
+    while True:
+        next_page_task = None
+        if starred_data.has_next_page and len(stated_repo_map) < max_repositories:
+            await ctx.info(f"Fetching next page of starred repositories, current count: {len(stated_repo_map)}")
+            next_page_task = asyncio.create_task(
+                _get_user_starred_repositories_impl(
+                    ctx=ctx, username=username, cursor=starred_data.end_cursor
+                )
+            )
 
         for repo in starred_data.repositories:
             if len(stated_repo_map) >= max_repositories:
                 break
             stated_repo_map[repo.repo_id] = StartedRepoWithReadme.model_construct(**repo.model_dump())
 
+        if next_page_task is None:
+            break
+        if len(stated_repo_map) >= max_repositories:
+            # Reap the task before abandoning it, or asyncio logs
+            # "Task exception was never retrieved" when it is collected
+            next_page_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await next_page_task
+            break
+        starred_data = await next_page_task
+
     return stated_repo_map
 
 
@@ -88,14 +103,23 @@ async def _fetch_repository_details(ctx: Context, repo_ids: list, concurrent_req
         async with semaphore:
             return await _get_batch_repo_details_impl(ctx=ctx, repo_ids=repo_ids_chunk)
 
-    # Execute concurrent requests
-    tasks = [fetch_chunk_details(chunk) for chunk in chunked_repo_ids]
-    chunk_results = await asyncio.gather(*tasks)
+    # Execute concurrent requests; TaskGroup cancels the outstanding
+    # chunk fetches as soon as one fails, instead of letting doomed
+    # requests run to completion against an unhealthy client.
+    try:
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(fetch_chunk_details(chunk))
+                for chunk in chunked_repo_ids
+            ]
+    except ExceptionGroup as eg:
+        # Surface the first failure; the remaining tasks are already cancelled.
+        raise eg.exceptions[0] from eg
 
     # Combine results
     all_details = {}
-    for result in chunk_results:
-        all_details.update(result.data)
+    for task in tasks:
+        all_details.update(task.result().data)
 
     return all_details
 
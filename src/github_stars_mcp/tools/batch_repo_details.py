@@ -5,6 +5,7 @@ import asyncio
 import structlog
 from fastmcp import Context
 
+from .. import shared
 from ..common.error_handlers import handle_github_api_errors
 from ..common.github_helpers import ensure_github_client
 from ..common.logging_helpers import log_function_call
@@ -20,6 +21,30 @@ logger = structlog.get_logger(__name__)
 MAX_BATCH_SIZE = 100
 
 
+def _validate_repository_id(repo_id: str) -> str:
+    """Validate a single repository ID.
+
+    Args:
+        repo_id: Repository ID to validate
+
+    Returns:
+        Validated repository ID
+
+    Raises:
+        ValidationError: If validation fails
+    """
+    if not repo_id or not str(repo_id).strip():
+        raise ValidationError("Repository ID cannot be empty")
+
+    repo_id = str(repo_id).strip()
+
+    # If it looks like owner/repo format, validate it
+    if "/" in repo_id:
+        validate_repo_name(repo_id)
+
+    return repo_id
+
+
 def validate_repository_ids(repo_ids: list[str]) -> list[str]:
     """Validate repository IDs list.
 
@@ -38,20 +63,9 @@ def validate_repository_ids(repo_ids: list[str]) -> list[str]:
     if len(repo_ids) > MAX_BATCH_SIZE:
         raise ValidationError(f"Cannot process more than {MAX_BATCH_SIZE} repositories at once")
 
-    validated_ids = []
-    for repo_id in repo_ids:
-        if not repo_id or not str(repo_id).strip():
-            raise ValidationError("Repository ID cannot be empty")
-
-        repo_id = str(repo_id).strip()
-
-        # If it looks like owner/repo format, validate it
-        if "/" in repo_id:
-            validate_repo_name(repo_id)
-
-        validated_ids.append(repo_id)
-
-    return validated_ids
+    # Comprehension builds the result in one sized allocation instead of
+    # append-growing, and keeps validated IDs aligned with input order.
+    return [_validate_repository_id(repo_id) for repo_id in repo_ids]
 
 
 async def fetch_single_repository_details(
@@ -67,10 +81,18 @@ async def fetch_single_repository_details(
 
             except Exception as e:
                 await ctx.info(f"Failed to fetch README for {repo_id}: {str(e)}")
-            logger.debug(f"Readme content for {repo_id}: {readme_result}")
-            # Create Repository and RepositoryDetails objects
-            repo_details = RepositoryDetails(
-                readme_content=readme_result["content"],
+            # Log only the size; READMEs can be tens of KB and the
+            # f-string would be built even when debug logging is off
+            readme_content = readme_result["content"]
+            logger.debug(
+                "Readme fetched",
+                repo_id=repo_id,
+                content_length=len(readme_content) if readme_content else 0,
+            )
+            # The readme payload is built in-process with a known shape,
+            # so skip Pydantic re-validation via model_construct
+            repo_details = RepositoryDetails.model_construct(
+                readme_content=readme_content,
             )
 
             return repo_details
@@ -93,7 +115,19 @@ async def fetch_multi_repository_details(
     except Exception as e:
         await ctx.info(f"Failed to fetch README for {repo_ids}: {str(e)}")
 
-    return BatchRepositoryDetailsResponse(data=readme_results)
+    # The client payload is assembled in-process with a trusted shape, so
+    # build the response with model_construct instead of re-validating
+    # every child. Values that are already RepositoryDetails instances
+    # pass through untouched.
+    data = {
+        repo_id: (
+            readme
+            if isinstance(readme, RepositoryDetails)
+            else RepositoryDetails.model_construct(**readme)
+        )
+        for repo_id, readme in readme_results.items()
+    }
+    return BatchRepositoryDetailsResponse.model_construct(data=data)
 
 
 @handle_github_api_errors("get batch repository details")
@@ -120,8 +154,7 @@ async def _get_batch_repo_details_impl(
     # Validate repository IDs
     validated_repo_ids = validate_repository_ids(repo_ids)
 
-    # Ensure GitHub client is available
-    from .. import shared
+    # Ensure GitHub client is available (attribute access keeps late binding)
     github_client = ensure_github_client(shared.github_client)
 
     # Fetch repository details
@@ -5,6 +5,7 @@ import asyncio
 import structlog
 from fastmcp import Context
 
+from .. import shared
 from ..common.error_handlers import handle_github_api_errors
 from ..common.github_helpers import ensure_github_client
 from ..common.logging_helpers import log_function_call
@@ -16,6 +17,10 @@ from .batch_repo_details import fetch_single_repository_details
 # Get structured logger
 logger = structlog.get_logger(__name__)
 
+# Single canonical implementation; importing this module must register
+# the get_repo_details tool on mcp exactly once.
+__all__ = ["get_repo_details"]
+
 
 @handle_github_api_errors("get repository details")
 @log_function_call("get_repo_details_impl")
@@ -40,8 +45,7 @@ async def _get_repo_details_impl(ctx: Context, repo_id: str) -> RepositoryDetail
     # Create semaphore for consistency with batch function
     semaphore = asyncio.Semaphore(1)
 
-    # Ensure GitHub client is available
-    from .. import shared
+    # Ensure GitHub client is available (attribute access keeps late binding)
     github_client = ensure_github_client(shared.github_client)
 
     # Use the existing fetch function from batch_repo_details
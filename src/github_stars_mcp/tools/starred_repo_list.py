@@ -1,8 +1,14 @@
 """Tool for retrieving user's starred repositories list."""
 
+import sys
+from datetime import datetime
+from operator import itemgetter
+
 import structlog
 from fastmcp import Context
+from pydantic import TypeAdapter
 
+from .. import shared
 from ..common.error_handlers import handle_github_api_errors
 from ..common.github_helpers import ensure_github_client, safe_github_request
 from ..common.logging_helpers import log_function_call
@@ -12,8 +18,83 @@ from ..shared import mcp
 
 logger = structlog.get_logger(__name__)
 
+# Built once at import time so pydantic-core iterates a whole page of
+# edges in native code instead of validating one model per Python loop
+# iteration.
+_REPO_LIST_ADAPTER = TypeAdapter(list[StartedRepository])
+
+# C-level accessors for the nested topic/language containers; applied
+# via map() they avoid a Python frame per element.
+_get_name = itemgetter("name")
+_get_topic = itemgetter("topic")
+_get_node = itemgetter("node")
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    """Parse an ISO-8601 timestamp from GraphQL, if present."""
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _node_to_dict(repo_data: dict, starred_at: str | None = None) -> dict:
+    """Flatten a repository node into a dict of model fields.
+
+    Args:
+        repo_data: Repository node from GitHub GraphQL response
+        starred_at: Edge-scoped starredAt timestamp, when available
+
+    Returns:
+        Dict keyed by StartedRepository field names, with datetimes
+        already parsed so the result can feed model_construct directly
+    """
+    name_with_owner: str = repo_data["nameWithOwner"]
+
+    # The query selects name and owner.login explicitly, so no string
+    # split of nameWithOwner is needed. Keep the split as a fallback for
+    # responses that predate those fields.
+    owner_data = repo_data.get("owner")
+    if owner_data:
+        owner = owner_data["login"]
+        name = repo_data["name"]
+    else:
+        owner, name = name_with_owner.split("/", maxsplit=1)
+
+    # Owners repeat heavily across a starred list; interning collapses
+    # the duplicates to one string object and makes dict-key hashing
+    # cheaper when the owner is used as a cache key downstream.
+    owner = sys.intern(owner)
+
+    # Bind nested containers once so each dict is only looked up a single
+    # time per repository instead of once per field access.
+    primary_language = repo_data.get("primaryLanguage")
+    topic_nodes = repo_data.get("repositoryTopics") or {}
+    language_edges = repo_data.get("languages") or {}
+
+    return {
+        "repo_id": repo_data["id"],
+        "name_with_owner": name_with_owner,
+        "name": name,
+        "owner": owner,
+        "description": repo_data.get("description"),
+        "stargazer_count": repo_data.get("stargazerCount"),
+        "url": repo_data.get("url"),
+        "primary_language": (
+            sys.intern(primary_language["name"]) if primary_language else None
+        ),
+        "starred_at": _parse_datetime(starred_at),
+        "pushed_at": _parse_datetime(repo_data.get("pushedAt")),
+        "disk_usage": repo_data.get("diskUsage"),
+        "repository_topics": list(
+            map(sys.intern, map(_get_name, map(_get_topic, topic_nodes.get("nodes", ()))))
+        ),
+        "languages": list(
+            map(sys.intern, map(_get_name, map(_get_node, language_edges.get("edges", ()))))
+        ),
+    }
 
 
+def _edge_to_dict(edge: dict) -> dict:
+    """Flatten an edges { node } wrapper from the full starred query."""
+    return _node_to_dict(edge["node"], edge.get("starredAt"))
 
 
 def _parse_repository_data(edge: dict) -> StartedRepository:
@@ -25,35 +106,7 @@ def _parse_repository_data(edge: dict) -> StartedRepository:
     Returns:
         StartedRepository object
     """
-    repo_data = edge["node"]
-    name_with_owner: str = repo_data["nameWithOwner"]
-    owner, name = name_with_owner.split("/", maxsplit=1)
-
-    return StartedRepository(
-        id=repo_data["id"],
-        nameWithOwner=name_with_owner,
-        name=name,
-        owner=owner,
-        description=repo_data.get("description"),
-        stargazerCount=repo_data.get("stargazerCount"),
-        url=repo_data.get("url"),
-        primaryLanguage=(
-            repo_data["primaryLanguage"].get("name")
-            if repo_data.get("primaryLanguage")
-            else None
-        ),
-        starredAt=edge.get("starredAt"),
-        pushedAt=repo_data.get("pushedAt"),
-        diskUsage=repo_data.get("diskUsage"),
-        repositoryTopics=[
-            topic["topic"]["name"]
-            for topic in repo_data.get("repositoryTopics", {}).get("nodes", [])
-        ],
-        languages=[
-            lang["node"]["name"]
-            for lang in repo_data.get("languages", {}).get("edges", [])
-        ],
-    )
+    return StartedRepository.model_validate(_edge_to_dict(edge))
 
 
 @handle_github_api_errors("get starred repositories")
@@ -65,8 +118,6 @@ async def _get_user_starred_repositories_impl(
 
     This function contains the core logic that can be called from other tools.
     """
-    from .. import shared
-
     # Validate username if provided
     if username:
         username = validate_github_username(username)
@@ -82,10 +133,36 @@ async def _get_user_starred_repositories_impl(
         cursor=cursor
     )
 
-    # Parse repositories
+    # Parse repositories. GraphQL guarantees a uniform row shape, so
+    # fully validate only the first row as a sanity check and build the
+    # rest with model_construct, skipping validator dispatch per row.
+    # Cheap membership checks filter malformed rows (null node, missing
+    # name) up front, instead of paying exception setup per row and
+    # masking real bugs with a broad except.
+    edges = response.get("edges")
+    if edges is not None:
+        repo_dicts = [
+            _edge_to_dict(edge)
+            for edge in edges
+            if (node := edge.get("node")) and "nameWithOwner" in node
+        ]
+        skipped = len(edges) - len(repo_dicts)
+    else:
+        # Lean query pages return flat nodes with no edge wrapper
+        nodes = response.get("nodes", [])
+        repo_dicts = [
+            _node_to_dict(node)
+            for node in nodes
+            if node and "nameWithOwner" in node
+        ]
+        skipped = len(nodes) - len(repo_dicts)
+
+    if skipped:
+        logger.warning("Skipped malformed repository rows", skipped=skipped)
+    if repo_dicts:
+        _REPO_LIST_ADAPTER.validate_python(repo_dicts[:1])
     repositories = [
-        _parse_repository_data(edge)
-        for edge in response.get("edges", [])
+        StartedRepository.model_construct(**repo_dict) for repo_dict in repo_dicts
     ]
 
     result = StarredRepositoriesResponse(
@@ -1,15 +1,16 @@
 """GitHub API client module."""
 
+import asyncio
+import functools
+import hashlib
+import json
+import random
+import time
 from typing import Any
 
 import httpx
+import orjson
 import structlog
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
 
 from ..config import settings
 from ..exceptions import AuthenticationError, GitHubAPIError, RateLimitError
@@ -17,12 +18,103 @@ from ..exceptions import AuthenticationError, GitHubAPIError, RateLimitError
 # Configure structured logging
 logger = structlog.get_logger(__name__)
 
+# How long cached GraphQL responses stay fresh without revalidation.
+# Entries with an ETag are revalidated via If-None-Match after expiry;
+# a 304 answer costs no rate-limit points.
+CACHE_TTL_SECONDS = 300.0
+
+# Bound on cached responses; the oldest entry is evicted past this.
+CACHE_MAX_ENTRIES = 256
+
+# When the reported rate-limit budget drops below this floor, wait for
+# the reset instead of burning the last requests into 403 responses.
+RATE_LIMIT_MIN_REMAINING = 10
+
+# The authenticated viewer never changes for a given token within a
+# session; cache it generously to save a round-trip per tool call.
+USER_CACHE_TTL_SECONDS = 3600.0
+
+# Upper bound on any single retry sleep, server-advised or backed off.
+RETRY_MAX_WAIT_SECONDS = 30.0
+
+
+@functools.lru_cache(maxsize=32)
+def _query_name(query: str) -> str:
+    """Extract the operation name from a GraphQL query for logging.
+
+    Cached so the ~1KB query constants are only split once instead of
+    on every request.
+    """
+    parts = query.split(None, 2)
+    return parts[1] if len(parts) > 1 else "unknown"
+
+
+@functools.lru_cache(maxsize=32)
+def _query_prefix(query: str) -> bytes:
+    """Pre-encoded ``{"query": "..."`` prefix for a query constant.
+
+    JSON-escaping the multi-KB query string dominates payload encoding;
+    caching the encoded prefix leaves only the small variables dict to
+    serialize per request.
+    """
+    return orjson.dumps({"query": query})[:-1]
+
+
+def _encode_payload(query: str, variables: dict[str, Any] | None) -> bytes:
+    """Build the GraphQL request body from pre-encoded parts."""
+    prefix = _query_prefix(query)
+    if not variables:
+        return prefix + b"}"
+    return prefix + b',"variables":' + orjson.dumps(variables) + b"}"
+
+
+class AsyncRateLimiter:
+    """Proactive rate limiter driven by GitHub's X-RateLimit headers.
+
+    GitHub reports the remaining budget and reset time on every
+    response. Tracking them lets the client sleep until the reset when
+    the budget is nearly exhausted, rather than detecting exhaustion
+    after a 403 and retrying.
+    """
+
+    def __init__(self, min_remaining: int = RATE_LIMIT_MIN_REMAINING):
+        self.min_remaining = min_remaining
+        self.remaining: int | None = None
+        self.reset_at: float = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request can be sent within the rate budget."""
+        async with self._lock:
+            if self.remaining is not None and self.remaining < self.min_remaining:
+                delay = self.reset_at - time.time()
+                if delay > 0:
+                    logger.warning(
+                        "Rate limit nearly exhausted, waiting for reset",
+                        remaining=self.remaining,
+                        delay_seconds=round(delay, 1),
+                    )
+                    await asyncio.sleep(delay)
+                # Budget has reset; forget stale numbers until the next
+                # response reports fresh ones.
+                self.remaining = None
+
+    def update(self, headers) -> None:
+        """Record the rate-limit state reported by a response."""
+        try:
+            remaining = int(headers.get("x-ratelimit-remaining"))
+            reset_at = float(headers.get("x-ratelimit-reset"))
+        except (TypeError, ValueError):
+            return
+        self.remaining = remaining
+        self.reset_at = reset_at
+
 # GraphQL query constants
 STARRED_REPOS_QUERY = """
-query GetStarredRepositories($username: String!, $cursor: String) {
+query GetStarredRepositories($username: String!, $cursor: String, $first: Int = 100) {
   user(login: $username) {
     starredRepositories(
-      first: 100
+      first: $first
       after: $cursor
       orderBy: { field: STARRED_AT, direction: DESC }
     ) {
@@ -31,17 +123,19 @@ query GetStarredRepositories($username: String!, $cursor: String) {
         hasNextPage
       }
       edges {
-        cursor
         starredAt
         node {
           id
           nameWithOwner
+          name
+          owner {
+            login
+          }
           description
           stargazerCount
           url
           diskUsage
           pushedAt
-          forkCount
           primaryLanguage {
             name
           }
@@ -54,10 +148,8 @@ query GetStarredRepositories($username: String!, $cursor: String) {
           }
           languages(first: 5, orderBy: { field: SIZE, direction: DESC }) {
             edges {
-              size
               node {
                 name
-                color
               }
             }
           }
@@ -69,6 +161,94 @@ query GetStarredRepositories($username: String!, $cursor: String) {
 
 """
 
+# Lean variant without topics, languages and disk usage; costs fewer
+# GraphQL points and decodes to a much smaller tree when callers only
+# need core repository metadata. It also returns flat nodes instead of
+# edges { node } — starredAt is edge-scoped, so callers that need it
+# must use the full query — halving the JSON nesting to decode.
+STARRED_REPOS_QUERY_LEAN = """
+query GetStarredRepositoriesLean($username: String!, $cursor: String, $first: Int = 100) {
+  user(login: $username) {
+    starredRepositories(
+      first: $first
+      after: $cursor
+      orderBy: { field: STARRED_AT, direction: DESC }
+    ) {
+      pageInfo {
+        endCursor
+        hasNextPage
+      }
+      nodes {
+        id
+        nameWithOwner
+        name
+        owner {
+          login
+        }
+        description
+        stargazerCount
+        url
+        pushedAt
+        primaryLanguage {
+          name
+        }
+      }
+    }
+  }
+}
+"""
+
+# Selection used per user alias in the multi-user batch query; mirrors
+# the lean starred query's flat node shape.
+_STARRED_BATCH_SELECTION = """
+    starredRepositories(
+      first: $first
+      orderBy: { field: STARRED_AT, direction: DESC }
+    ) {
+      pageInfo {
+        endCursor
+        hasNextPage
+      }
+      nodes {
+        id
+        nameWithOwner
+        name
+        owner {
+          login
+        }
+        description
+        stargazerCount
+        url
+        pushedAt
+        primaryLanguage {
+          name
+        }
+      }
+    }
+"""
+
+# GitHub's complexity scoring makes very wide batches expensive; ten
+# aliases keeps a batch well under the per-request node limit.
+STARRED_BATCH_MAX_ALIASES = 10
+
+
+@functools.lru_cache(maxsize=8)
+def _starred_batch_query(count: int) -> str:
+    """Build the aliased multi-user starred query for a batch size.
+
+    Sibling aliases are resolved concurrently on GitHub's side, so one
+    request covers the whole batch. Only one query string exists per
+    batch size, so caching keeps the strings eligible for the prefix
+    and name caches.
+    """
+    var_defs = ", ".join(f"$u{i}: String!" for i in range(count))
+    aliases = "\n".join(
+        f"  u{i}: user(login: $u{i}) {{{_STARRED_BATCH_SELECTION}  }}"
+        for i in range(count)
+    )
+    return f"query GetStarredForMany({var_defs}, $first: Int = 100) {{\n{aliases}\n}}"
+
+
 CURRENT_USER_QUERY = """
 query GetCurrentUser {
   viewer {
@@ -79,46 +259,74 @@ query GetCurrentUser {
 }
 """
 
-README_QUERY_BY_ID = """
-query GetReadmeById($id: ID!) {
-  node(id: $id) {
-    ... on Repository {
-      id
-      nameWithOwner
-
-      # 修正后的部分：使用 object 字段按路径表达式查找文件
+# All plausible README filenames are requested as aliased blobs in one
+# query, so repositories without README.md resolve in the same
+# round-trip instead of needing a follow-up request per fallback name.
+_README_SELECTIONS = """
       readme: object(expression: "HEAD:README.md") {
-        # 如果该对象是一个文件 (Blob)，则获取其文本内容
         ... on Blob {
           text
         }
       }
-    }
-  }
-}
+      readmeRst: object(expression: "HEAD:README.rst") {
+        ... on Blob {
+          text
+        }
+      }
+      readmeTxt: object(expression: "HEAD:README.txt") {
+        ... on Blob {
+          text
+        }
+      }
+      readmePlain: object(expression: "HEAD:README") {
+        ... on Blob {
+          text
+        }
+      }
+      readmeLower: object(expression: "HEAD:readme.md") {
+        ... on Blob {
+          text
+        }
+      }
 """
 
-README_QUERY_BY_IDS = """
-query GetMultipleReadmesByIds($ids: [ID!]!) {
-  nodes(ids: $ids) {
-    # 对每个节点，如果它是一个仓库...
-    ... on Repository {
+# Checked in priority order when extracting the blob text from a node.
+_README_ALIASES = ("readme", "readmeRst", "readmeTxt", "readmePlain", "readmeLower")
+
+README_QUERY_BY_ID = f"""
+query GetReadmeById($id: ID!) {{
+  node(id: $id) {{
+    ... on Repository {{
       id
       nameWithOwner
+{_README_SELECTIONS}
+    }}
+  }}
+}}
+"""
 
-      # --- 这里是应用了相同修正的部分 ---
-      readme: object(expression: "HEAD:README.md") {
-        ... on Blob {
-          text
-        }
-      }
-      # ------------------------------------
-    }
-  }
-}
+README_QUERY_BY_IDS = f"""
+query GetMultipleReadmesByIds($ids: [ID!]!) {{
+  nodes(ids: $ids) {{
+    ... on Repository {{
+      id
+      nameWithOwner
+{_README_SELECTIONS}
+    }}
+  }}
+}}
 """
 
 
+def _first_readme_text(node: dict[str, Any]) -> str | None:
+    """Return the text of the first non-null aliased README blob."""
+    for alias in _README_ALIASES:
+        blob = node.get(alias)
+        if blob:
+            return blob.get("text")
+    return None
+
+
 class GitHubClient:
     """Async GitHub API client with GraphQL support.
 
@@ -126,11 +334,15 @@ class GitHubClient:
     with proper authentication, error handling, and retry logic.
     """
 
-    def __init__(self, token: str | None = None):
+    def __init__(
+        self, token: str | None = None, client: httpx.AsyncClient | None = None
+    ):
         """Initialize GitHub client.
 
         Args:
             token: GitHub personal access token. If not provided, uses settings.github_token
+            client: Optional pre-configured httpx client; tests inject one
+                backed by httpx.MockTransport
         """
         self.token = token or settings.github_token
         if not self.token:
@@ -140,105 +352,230 @@ class GitHubClient:
         self.headers = {
             "Authorization": f"Bearer {self.token}",
             "Accept": "application/vnd.github.v4+json",
+            # Repo lists are dominated by repetitive JSON keys and
+            # compress 5-10x; httpx decodes transparently (br needs the
+            # brotli package)
+            "Accept-Encoding": "gzip, br",
+            "Content-Type": "application/json",
             "User-Agent": "github-stars-mcp-server/1.0",
         }
+        self._client: httpx.AsyncClient | None = client
+        self._response_cache: dict[str, dict[str, Any]] = {}
+        self._limiter = AsyncRateLimiter()
+        self._current_user: dict[str, Any] | None = None
+        self._current_user_ts = 0.0
+        self._current_user_lock = asyncio.Lock()
+        # Retry tuning; attempts beyond the first sleep with jittered
+        # exponential backoff, or the server-advised delay when known.
+        self.max_retries = 3
+        self.retry_base_delay = 1.0
+
+    @staticmethod
+    def _retry_after_seconds(headers) -> float | None:
+        """Extract the server-advised retry delay from response headers."""
+        try:
+            retry_after = headers.get("Retry-After")
+            if retry_after is not None:
+                return max(float(retry_after), 0.0)
+            reset_at = headers.get("x-ratelimit-reset")
+            if reset_at is not None:
+                return max(float(reset_at) - time.time(), 0.0)
+        except (TypeError, ValueError):
+            pass
+        return None
+
+    @staticmethod
+    def _cache_key(query: str, variables: dict[str, Any] | None) -> str:
+        """Build a stable cache key for a query and its variables."""
+        raw = query + json.dumps(variables or {}, sort_keys=True)
+        # blake2b is faster than sha256 and a 16-byte digest is plenty
+        # for cache bucketing
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it lazily.
+
+        A single long-lived client keeps connections alive across
+        GraphQL requests, so repeated queries skip DNS resolution and
+        the TCP/TLS handshake.
+        """
+        if self._client is None or self._client.is_closed:
+            # HTTP/2 lets concurrent page fetches multiplex over one
+            # TCP+TLS connection instead of contending for pool slots
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=httpx.Timeout(30.0, connect=10.0),
+                limits=httpx.Limits(
+                    max_keepalive_connections=10,
+                    max_connections=20,
+                    keepalive_expiry=30.0,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its connection pool."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
 
-
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type((httpx.RequestError, httpx.TimeoutException)),
-    )
     async def query(
         self, query: str, variables: dict[str, Any] | None = None
     ) -> dict[str, Any]:
-        """Execute a GraphQL query against GitHub API.
+        """Execute a GraphQL query against GitHub API, with retries.
+
+        Transient failures (network errors, timeouts, rate limits) are
+        retried up to max_retries times with jittered exponential
+        backoff; a server-advised Retry-After delay is honored when
+        present. The inline loop replaces the previous tenacity
+        decorator, whose per-call state setup was pure overhead on the
+        cache/304 fast paths.
 
         Args:
             query: GraphQL query string
             variables: Optional query variables
 
         Returns:
-            GraphQL response data
+            GraphQL response data. Fresh repeats of a query are served
+            the cached mapping itself, shared across callers; treat it
+            as read-only (mutations would poison the cache).
 
         Raises:
             AuthenticationError: If authentication fails
             RateLimitError: If rate limit is exceeded
             GitHubAPIError: For other API errors
         """
-        payload = {"query": query}
-        if variables:
-            payload["variables"] = variables
-
-        logger.info(
-            "Executing GraphQL query",
-            query_type=query.split()[1] if query.split() else "unknown",
-        )
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        for attempt in range(1, self.max_retries + 1):
             try:
-                response = await client.post(
-                    self.base_url, headers=self.headers, json=payload
+                return await self._query_once(query, variables)
+            except (httpx.RequestError, RateLimitError) as e:
+                if attempt >= self.max_retries:
+                    if isinstance(e, RateLimitError):
+                        raise
+                    logger.error("Request error", error=str(e))
+                    raise GitHubAPIError(f"Request failed: {str(e)}") from e
+                if isinstance(e, RateLimitError) and e.retry_after is not None:
+                    delay = e.retry_after
+                else:
+                    delay = self.retry_base_delay * (2 ** (attempt - 1))
+                    delay += random.uniform(0.0, delay)
+                delay = min(delay, RETRY_MAX_WAIT_SECONDS)
+                logger.warning(
+                    "Retrying GraphQL query",
+                    attempt=attempt,
+                    delay_seconds=round(delay, 2),
+                    error=str(e),
                 )
+                await asyncio.sleep(delay)
+        raise AssertionError("unreachable")  # pragma: no cover
 
-                # Handle HTTP errors
-                if response.status_code == 401:
-                    logger.error(
-                        "Authentication failed", status_code=response.status_code
-                    )
-                    raise AuthenticationError("Invalid GitHub token")
-                elif response.status_code == 403:
-                    # Check if it's a rate limit error
-                    if "rate limit" in response.text.lower():
-                        logger.warning(
-                            "Rate limit exceeded", status_code=response.status_code
-                        )
-                        raise RateLimitError("GitHub API rate limit exceeded")
-                    else:
-                        logger.error(
-                            "Forbidden access", status_code=response.status_code
-                        )
-                        raise GitHubAPIError(f"Forbidden: {response.text}")
-                elif response.status_code >= 400:
-                    logger.error(
-                        "HTTP error",
-                        status_code=response.status_code,
-                        response_text=response.text,
-                    )
-                    raise GitHubAPIError(
-                        f"HTTP {response.status_code}: {response.text}"
-                    )
-
-                data = response.json()
-
-                # Handle GraphQL errors
-                if "errors" in data:
-                    errors = data["errors"]
-                    logger.error("GraphQL errors", errors=errors)
-                    error_messages = [
-                        error.get("message", "Unknown error") for error in errors
-                    ]
-                    raise GitHubAPIError(f"GraphQL errors: {'; '.join(error_messages)}")
-
-                logger.info("GraphQL query successful")
-                return data.get("data", {})
-
-            except httpx.RequestError as e:
-                logger.error("Request error", error=str(e))
-                raise GitHubAPIError(f"Request failed: {str(e)}") from e
-            except httpx.TimeoutException as e:
-                logger.error("Request timeout", error=str(e))
-                raise GitHubAPIError(f"Request timeout: {str(e)}") from e
+    async def _query_once(
+        self, query: str, variables: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Single query attempt; see query() for the retry wrapper."""
+        # Serve identical queries from cache while fresh; this saves a
+        # round-trip and GitHub rate-limit quota on repeated tool calls.
+        cache_key = self._cache_key(query, variables)
+        cached = self._response_cache.get(cache_key)
+        if cached and time.monotonic() - cached["ts"] < CACHE_TTL_SECONDS:
+            logger.debug("GraphQL response served from cache")
+            return cached["data"]
+
+        headers = self.headers
+        if cached and cached.get("etag"):
+            headers = {**self.headers, "If-None-Match": cached["etag"]}
+
+        logger.info("Executing GraphQL query", query_type=_query_name(query))
+
+        client = self._get_http_client()
+        await self._limiter.acquire()
+        # orjson serializes the payload and decodes the response in
+        # native code, several times faster than stdlib json on the
+        # deeply nested starred-repository trees
+        response = await client.post(
+            self.base_url,
+            headers=headers,
+            content=_encode_payload(query, variables),
+        )
+        self._limiter.update(response.headers)
+
+        # A 304 answer means the cached entry is still valid
+        if response.status_code == 304 and cached:
+            cached["ts"] = time.monotonic()
+            logger.debug("GraphQL response revalidated via ETag")
+            return cached["data"]
+
+        # Handle HTTP errors
+        if response.status_code == 401:
+            logger.error(
+                "Authentication failed", status_code=response.status_code
+            )
+            raise AuthenticationError("Invalid GitHub token")
+        elif response.status_code in (403, 429):
+            # Check if it's a rate limit error
+            if response.status_code == 429 or "rate limit" in response.text.lower():
+                retry_after = self._retry_after_seconds(response.headers)
+                logger.warning(
+                    "Rate limit exceeded",
+                    status_code=response.status_code,
+                    retry_after=retry_after,
+                )
+                raise RateLimitError(
+                    "GitHub API rate limit exceeded", retry_after=retry_after
+                )
+            else:
+                logger.error(
+                    "Forbidden access", status_code=response.status_code
+                )
+                raise GitHubAPIError(f"Forbidden: {response.text}")
+        elif response.status_code >= 400:
+            logger.error(
+                "HTTP error",
+                status_code=response.status_code,
+                response_text=response.text,
+            )
+            raise GitHubAPIError(
+                f"HTTP {response.status_code}: {response.text}"
+            )
+
+        data = orjson.loads(response.content)
+
+        # Handle GraphQL errors
+        if "errors" in data:
+            errors = data["errors"]
+            logger.error("GraphQL errors", errors=errors)
+            error_messages = [
+                error.get("message", "Unknown error") for error in errors
+            ]
+            raise GitHubAPIError(f"GraphQL errors: {'; '.join(error_messages)}")
+
+        logger.info("GraphQL query successful")
+        result = data.get("data", {})
+        if len(self._response_cache) >= CACHE_MAX_ENTRIES:
+            oldest = min(
+                self._response_cache, key=lambda k: self._response_cache[k]["ts"]
+            )
+            del self._response_cache[oldest]
+        self._response_cache[cache_key] = {
+            "ts": time.monotonic(),
+            "etag": response.headers.get("ETag"),
+            "data": result,
+        }
+        return result
 
     async def get_user_starred_repositories(
-        self, username: str, cursor: str | None = None
+        self,
+        username: str,
+        cursor: str | None = None,
+        first: int = 100,
+        lean: bool = False,
     ) -> dict[str, Any]:
         """Get starred repositories for a user with pagination support.
 
         Args:
             username: GitHub username. If empty, uses authenticated user.
             cursor: Pagination cursor for fetching next page
+            first: Page size (max 100); smaller pages cost fewer GraphQL points
+            lean: Skip topics, languages and disk usage for a cheaper query
 
         Returns:
             Dictionary containing starred repositories data with pagination info
@@ -264,41 +601,109 @@ class GitHubClient:
             "Fetching starred repositories", username=actual_username, cursor=cursor
         )
 
-        variables = {"username": actual_username, "cursor": cursor}
-        data = await self.query(STARRED_REPOS_QUERY, variables)
-        logger.debug("Starred repositories data", data=data)
+        variables = {"username": actual_username, "cursor": cursor, "first": first}
+        query = STARRED_REPOS_QUERY_LEAN if lean else STARRED_REPOS_QUERY
+        data = await self.query(query, variables)
         user_data = data.get("user")
         if not user_data:
             logger.warning("User not found", username=actual_username)
             return {"edges": [], "pageInfo": {"hasNextPage": False, "endCursor": None}}
 
         starred_data = user_data.get("starredRepositories", {})
+        # Log a summary only; dumping the full page is O(repos x fields)
+        # string building per call
+        logger.debug(
+            "Starred repositories page fetched",
+            edge_count=len(starred_data.get("edges", [])),
+            has_next_page=starred_data.get("pageInfo", {}).get("hasNextPage"),
+        )
         return starred_data
 
+    async def get_starred_for_many(
+        self, usernames: list[str], first: int = 100
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch the first starred-repositories page for several users.
+
+        Users are grouped into aliased selections within one GraphQL
+        request (up to STARRED_BATCH_MAX_ALIASES per request), so N
+        users cost ceil(N / 10) round-trips instead of N. Pages beyond
+        the first still require per-user cursor pagination.
+
+        Args:
+            usernames: GitHub usernames to query
+            first: Page size per user (max 100)
+
+        Returns:
+            Mapping of username to its starredRepositories data, with
+            flat nodes like the lean query; unknown users map to an
+            empty page
+        """
+        empty_page = {
+            "nodes": [],
+            "pageInfo": {"hasNextPage": False, "endCursor": None},
+        }
+        results: dict[str, dict[str, Any]] = {}
+        for start in range(0, len(usernames), STARRED_BATCH_MAX_ALIASES):
+            batch = usernames[start : start + STARRED_BATCH_MAX_ALIASES]
+            variables: dict[str, Any] = {
+                f"u{i}": username for i, username in enumerate(batch)
+            }
+            variables["first"] = first
+            data = await self.query(_starred_batch_query(len(batch)), variables)
+            for i, username in enumerate(batch):
+                user_data = data.get(f"u{i}")
+                if not user_data:
+                    logger.warning("User not found", username=username)
+                    results[username] = empty_page
+                else:
+                    results[username] = user_data.get("starredRepositories", empty_page)
+        return results
+
     async def get_current_user(self) -> dict[str, Any] | None:
         """Get current authenticated user information with caching.
 
         Returns:
             Current user information or None if authentication fails
         """
-        logger.info("Fetching current user info from API")
+        # The client is bound to one token, so an instance attribute is a
+        # per-token cache; this skips a full round-trip on every tool
+        # call that omits a username.
+        if self._current_user_valid():
+            return self._current_user
 
-        try:
-            data = await self.query(CURRENT_USER_QUERY)
+        # Double-checked locking: concurrent cold-cache callers coalesce
+        # into a single viewer fetch instead of one request each.
+        async with self._current_user_lock:
+            if self._current_user_valid():
+                return self._current_user
 
-            user_data = data.get("viewer")
-            if user_data:
-                logger.info(
-                    "Current user info fetched successfully",
-                    username=user_data.get("login"),
-                )
-            else:
-                logger.warning("Failed to fetch current user info")
+            logger.info("Fetching current user info from API")
 
-            return user_data
-        except Exception as e:
-            logger.error("Error fetching current user info", error=str(e))
-            return None
+            try:
+                data = await self.query(CURRENT_USER_QUERY)
+
+                user_data = data.get("viewer")
+                if user_data:
+                    self._current_user = user_data
+                    self._current_user_ts = time.monotonic()
+                    logger.info(
+                        "Current user info fetched successfully",
+                        username=user_data.get("login"),
+                    )
+                else:
+                    logger.warning("Failed to fetch current user info")
+
+                return user_data
+            except Exception as e:
+                logger.error("Error fetching current user info", error=str(e))
+                return None
+
+    def _current_user_valid(self) -> bool:
+        """Check whether the cached viewer info is still fresh."""
+        return (
+            self._current_user is not None
+            and time.monotonic() - self._current_user_ts < USER_CACHE_TTL_SECONDS
+        )
 
     async def get_repository_readme(self, repo_id: str) -> dict[str, Any]:
         """Get README content for a repository.
@@ -313,7 +718,6 @@ class GitHubClient:
 
         try:
             data = await self.query(README_QUERY_BY_ID, {"id": repo_id})
-            logger.debug("Repository data", repo_data=data)
 
             node_data = data.get("node")
             if not node_data:
@@ -323,7 +727,7 @@ class GitHubClient:
                 }
 
             return {
-                "content": node_data.get("readme", {}).get("text"),
+                "content": _first_readme_text(node_data),
             }
 
         except Exception as e:
@@ -352,13 +756,10 @@ class GitHubClient:
             if not nodes_data:
                 logger.warning("Repository not found", repo_id=repo_ids)
                 return {}
-            logger.debug("Repository readme nodes_data", nodes_data=nodes_data[:10])
+            logger.debug("Repository readme nodes fetched", node_count=len(nodes_data))
             return {
                 node["id"]: {
-                    "readme_content": node["readme"]["text"]
-                    if node["readme"]
-                    else None,
-                    # "nameWithOwner": node["nameWithOwner"],
+                    "readme_content": _first_readme_text(node),
                 }
                 for node in nodes_data
             }
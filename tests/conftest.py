@@ -1,30 +1,60 @@
 """Pytest configuration and fixtures for GitHub Stars MCP Server tests."""
 
 import asyncio
+import importlib.util
 import os
-from typing import AsyncGenerator, Dict, Any
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 import httpx
 from fastmcp import Context
+from pydantic import TypeAdapter
 
 from github_stars_mcp.config import Settings
+from github_stars_mcp.models import StartedRepository, StarredRepositoriesResponse
 from github_stars_mcp.utils.github_client import GitHubClient
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy():
+    """Run async tests on uvloop when it is available.
+
+    The gather-heavy performance tests spend their time in loop
+    dispatch (everything is mocked); uvloop cuts that overhead. Falls
+    back to the stock policy on Windows or when uvloop is missing.
+    """
+    if sys.platform != "win32" and importlib.util.find_spec("uvloop"):
+        import uvloop
+
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_pydantic():
+    """Compile model validators once up front.
+
+    pydantic v2 builds the core schema lazily on first validation, so
+    without this the first test touching each model pays the cold-build
+    cost and skews per-test timing.
+    """
+    for cls in (StartedRepository, StarredRepositoriesResponse):
+        cls.model_rebuild()
+        TypeAdapter(cls)
 
 
 @pytest.fixture
 def test_settings() -> Settings:
-    """Create test settings with mock values."""
-    return Settings(
+    """Create test settings with mock values.
+
+    model_construct bypasses validation and env-source scanning; these
+    values are known-good and validation is tested in test_config.py.
+    """
+    return Settings.model_construct(
         github_token="test_token_123",
         log_level="DEBUG"
     )
@@ -57,47 +87,89 @@ async def github_client(test_settings: Settings, mock_httpx_client: AsyncMock) -
     return client
 
 
-@pytest.fixture
-def sample_repository_data() -> Dict[str, Any]:
-    """Sample repository data for testing."""
-    return {
-        "nameWithOwner": "octocat/Hello-World",
-        "name": "Hello-World",
-        "owner": "octocat",
-        "description": "This your first repo!",
-        "stargazerCount": 1420,
-        "url": "https://github.com/octocat/Hello-World",
-        "primaryLanguage": "Python",
-        "createdAt": "2011-01-26T19:01:12Z",
-        "updatedAt": "2011-01-26T19:14:43Z",
-        "pushedAt": "2011-01-26T19:06:43Z",
-        "isPrivate": False,
-        "isFork": False,
-        "isArchived": False
-    }
+# Built once at import; the session-scoped fixtures below hand out a
+# read-only view instead of rebuilding the dict for every test.
+_SAMPLE_REPOSITORY_DATA = {
+    "nameWithOwner": "octocat/Hello-World",
+    "name": "Hello-World",
+    "owner": "octocat",
+    "description": "This your first repo!",
+    "stargazerCount": 1420,
+    "url": "https://github.com/octocat/Hello-World",
+    "primaryLanguage": "Python",
+    "createdAt": "2011-01-26T19:01:12Z",
+    "updatedAt": "2011-01-26T19:14:43Z",
+    "pushedAt": "2011-01-26T19:06:43Z",
+    "isPrivate": False,
+    "isFork": False,
+    "isArchived": False
+}
+
+_SAMPLE_USER_DATA = {
+    "login": "octocat",
+    "name": "The Octocat",
+    "bio": "A great octopus",
+    "avatarUrl": "https://github.com/images/error/octocat_happy.gif",
+    "location": "San Francisco",
+    "company": "GitHub",
+    "email": "octocat@github.com",
+    "createdAt": "2011-01-25T18:44:36Z",
+    "updatedAt": "2017-11-01T21:56:45Z",
+    "publicRepos": 8,
+    "followers": 3938,
+    "following": 9
+}
 
 
-@pytest.fixture
-def sample_user_data() -> Dict[str, Any]:
-    """Sample user data for testing."""
-    return {
-        "login": "octocat",
-        "name": "The Octocat",
-        "bio": "A great octopus",
-        "avatarUrl": "https://github.com/images/error/octocat_happy.gif",
-        "location": "San Francisco",
-        "company": "GitHub",
-        "email": "octocat@github.com",
-        "createdAt": "2011-01-25T18:44:36Z",
-        "updatedAt": "2017-11-01T21:56:45Z",
-        "publicRepos": 8,
-        "followers": 3938,
-        "following": 9
-    }
+@pytest.fixture(scope="session")
+def large_repository_list() -> tuple[str, ...]:
+    """Create a large list of repositories for testing.
+
+    Session-scoped and returned as a tuple: 1000 f-strings are built
+    once per run and no test may append to the shared sequence.
+    """
+    return tuple(f"user/repo{i}" for i in range(1000))
+
+
+@pytest.fixture(scope="session")
+def mock_starred_response_large() -> StarredRepositoriesResponse:
+    """Create a large mock starred repositories response.
+
+    Building 1000 StartedRepository instances dominates fixture setup,
+    so the response is built once and shared read-only; inputs are
+    trusted, so model_construct skips validator dispatch per instance.
+    """
+    return StarredRepositoriesResponse.model_construct(
+        repositories=[
+            StartedRepository.model_construct(
+                repo_id=f"repo{i}",
+                name_with_owner=f"user/repo{i}",
+                name=f"repo{i}",
+                owner="user",
+                stargazer_count=100 + i,
+                url=f"https://github.com/user/repo{i}"
+            ) for i in range(1000)
+        ],
+        total_count=1000,
+        has_next_page=False,
+        end_cursor=""
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_repository_data() -> Mapping[str, Any]:
+    """Sample repository data for testing (read-only)."""
+    return MappingProxyType(_SAMPLE_REPOSITORY_DATA)
+
+
+@pytest.fixture(scope="session")
+def sample_user_data() -> Mapping[str, Any]:
+    """Sample user data for testing (read-only)."""
+    return MappingProxyType(_SAMPLE_USER_DATA)
 
 
 @pytest.fixture
-def sample_starred_repositories_response() -> Dict[str, Any]:
+def sample_starred_repositories_response() -> dict[str, Any]:
     """Sample starred repositories GraphQL response for testing."""
     return {
         "data": {
@@ -136,7 +208,7 @@ def sample_starred_repositories_response() -> Dict[str, Any]:
 
 
 @pytest.fixture
-def mock_httpx_response(sample_starred_repositories_response: Dict[str, Any]) -> MagicMock:
+def mock_httpx_response(sample_starred_repositories_response: dict[str, Any]) -> MagicMock:
     """Create a mock httpx response for testing."""
     response = MagicMock()
     response.status_code = 200
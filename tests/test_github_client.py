@@ -1,29 +1,225 @@
 """Tests for GitHub GraphQL client."""
 
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import AsyncMock, patch
+import sys
+import time
 import httpx
-from datetime import datetime, timedelta
+import orjson
+from types import MappingProxyType
+from typing import Final
 
-from github_stars_mcp.utils.github_client import GitHubClient
+from github_stars_mcp.utils.github_client import AsyncRateLimiter, GitHubClient
 from github_stars_mcp.config import Settings
-from github_stars_mcp.exceptions import GitHubAPIError
+from github_stars_mcp.exceptions import GitHubAPIError, RateLimitError
 
 
-class TestGitHubClient:
-    """Test cases for GitHubClient."""
+TOKEN = "test_token_123"
+
+# Built once at import; MappingProxyType keeps tests from mutating it.
+_EXPECTED_HEADERS = MappingProxyType({
+    "Authorization": f"Bearer {TOKEN}",
+    "Accept": "application/vnd.github.v4+json",
+    "User-Agent": "github-stars-mcp-server/1.0",
+})
+
+
+# Hoisted out of test_real_query_structure so the ~1KB query literal and
+# the nested mock response are built once at import; treat as read-only
+# (a MappingProxyType wrapper would break orjson serialization in the
+# MockTransport helper).
+# Interned so repeated lookups (cache keys, prefix caches) hash one
+# canonical string object instead of a fresh 1KB literal per reference.
+REAL_QUERY: Final[str] = sys.intern("""
+query GetUserStarredRepositories($username: String!, $first: Int!, $after: String) {
+    user(login: $username) {
+        starredRepositories(first: $first, after: $after, orderBy: {field: STARRED_AT, direction: DESC}) {
+            edges {
+                starredAt
+                node {
+                    nameWithOwner
+                    description
+                    stargazerCount
+                    url
+                    primaryLanguage {
+                        name
+                        color
+                    }
+                    createdAt
+                    updatedAt
+                    pushedAt
+                    isPrivate
+                    isFork
+                    isArchived
+                    owner {
+                        login
+                        avatarUrl
+                        ... on User {
+                            name
+                            bio
+                            location
+                            company
+                            email
+                            createdAt
+                            updatedAt
+                            publicRepos
+                            followers
+                            following
+                        }
+                        ... on Organization {
+                            name
+                            description
+                            location
+                            email
+                            createdAt
+                            updatedAt
+                        }
+                    }
+                }
+            }
+            pageInfo {
+                endCursor
+                hasNextPage
+                hasPreviousPage
+                startCursor
+            }
+            totalCount
+        }
+    }
+}
+""")
+
+REAL_RESPONSE = {
+    "data": {
+        "user": {
+            "starredRepositories": {
+                "edges": [
+                    {
+                        "starredAt": "2023-01-01T00:00:00Z",
+                        "node": {
+                            "nameWithOwner": "octocat/Hello-World",
+                            "description": "This your first repo!",
+                            "stargazerCount": 1420,
+                            "url": "https://github.com/octocat/Hello-World",
+                            "primaryLanguage": {
+                                "name": "Python",
+                                "color": "#3572A5"
+                            },
+                            "createdAt": "2011-01-26T19:01:12Z",
+                            "updatedAt": "2023-01-01T00:00:00Z",
+                            "pushedAt": "2023-01-01T00:00:00Z",
+                            "isPrivate": False,
+                            "isFork": False,
+                            "isArchived": False,
+                            "owner": {
+                                "login": "octocat",
+                                "avatarUrl": "https://github.com/images/error/octocat_happy.gif",
+                                "name": "The Octocat",
+                                "bio": "A great octopus",
+                                "location": "San Francisco",
+                                "company": "GitHub",
+                                "email": "octocat@github.com",
+                                "createdAt": "2008-01-14T04:33:35Z",
+                                "updatedAt": "2023-01-01T00:00:00Z",
+                                "publicRepos": 8,
+                                "followers": 3938,
+                                "following": 9
+                            }
+                        }
+                    }
+                ],
+                "pageInfo": {
+                    "endCursor": "cursor123",
+                    "hasNextPage": True,
+                    "hasPreviousPage": False,
+                    "startCursor": "cursor000"
+                },
+                "totalCount": 100
+            }
+        }
+    }
+}
+
+
+# Serialized once at import; handlers serve these bytes directly instead
+# of re-encoding the dicts on every test invocation.
+_REAL_RESPONSE_BODY = orjson.dumps(REAL_RESPONSE)
+
+
+class FakeResponse:
+    """Minimal httpx.Response stand-in for error-injection tests.
+
+    Plain slotted attributes avoid MagicMock's __getattr__ interception
+    (and per-attribute mock construction) on every access.
+    """
+
+    __slots__ = ("status_code", "content", "text", "headers")
+
+    def __init__(self, status_code: int, content: bytes = b"", text: str = ""):
+        self.status_code = status_code
+        self.content = content
+        self.text = text
+        self.headers: dict[str, str] = {}
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+def _respond_with(data=None, status_code=200, content=None):
+    """Build a MockTransport handler serving one pre-encoded response.
+
+    Returns the handler plus the list of requests it receives, so tests
+    can assert on the outgoing payload without MagicMock call tracking.
+    """
+    requests: list[httpx.Request] = []
+    body = content if content is not None else orjson.dumps(data)
 
-    @pytest.fixture
-    def client_settings(self):
-        """Create test settings for GitHub client."""
-        return Settings(
-            github_token="test_token_123"
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            status_code,
+            content=body,
+            headers={"Content-Type": "application/json"},
         )
 
-    @pytest.fixture
-    def github_client(self, client_settings):
-        """Create GitHub client instance for testing."""
-        return GitHubClient(client_settings.github_token)
+    return handler, requests
+
+
+def _mock_transport_client(token: str, handler) -> GitHubClient:
+    """Create a GitHubClient backed by an httpx.MockTransport.
+
+    MockTransport serves real httpx.Response objects through the real
+    client code path, avoiding MagicMock attribute-lookup overhead on
+    every request.
+    """
+    transport = httpx.MockTransport(handler)
+    return GitHubClient(token, client=httpx.AsyncClient(transport=transport))
+
+
+# Session-scoped: Settings() construction stats and parses .env sources,
+# and GitHubClient.__init__ only stores the token and headers, so one
+# instance of each can serve every test. Tests that mutate client state
+# build a fresh instance inline instead.
+@pytest.fixture(scope="session")
+def client_settings():
+    """Create test settings for GitHub client.
+
+    model_construct skips the validator chain and env-source scanning;
+    validation itself is covered by the TestSettings suite.
+    """
+    return Settings.model_construct(
+        github_token=TOKEN
+    )
+
+
+@pytest.fixture(scope="session")
+def github_client(client_settings):
+    """Create GitHub client instance for testing."""
+    return GitHubClient(client_settings.github_token)
+
+
+class TestGitHubClient:
+    """Test cases for GitHubClient."""
 
     def test_client_initialization(self, github_client, client_settings):
         """Test GitHub client initialization."""
@@ -32,7 +228,7 @@ class TestGitHubClient:
         assert "Bearer" in github_client.headers["Authorization"]
 
     @pytest.mark.asyncio
-    async def test_execute_query_success(self, github_client):
+    async def test_execute_query_success(self):
         """Test successful GraphQL query execution."""
         # Mock response data
         mock_response_data = {
@@ -44,35 +240,29 @@ class TestGitHubClient:
             }
         }
         
-        # Mock httpx client
-        with patch('httpx.AsyncClient') as mock_async_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = mock_response_data
-            mock_response.raise_for_status.return_value = None
-            
-            mock_client = mock_async_client.return_value.__aenter__.return_value
-            mock_client.post = AsyncMock(return_value=mock_response)
-            
-            query = "query { user(login: $username) { login name } }"
-            variables = {"username": "testuser"}
-            
-            result = await github_client.query(query, variables)
-            
-            assert result == mock_response_data["data"]
-            
-            # Verify the request was made correctly
-            mock_client.post.assert_called_once_with(
-                github_client.base_url,
-                json={
-                    "query": query,
-                    "variables": variables
-                },
-                headers=github_client.headers
-            )
+        handler, requests = _respond_with(mock_response_data)
+        client = _mock_transport_client(TOKEN, handler)
+
+        query = "query { user(login: $username) { login name } }"
+        variables = {"username": "testuser"}
+
+        result = await client.query(query, variables)
+
+        assert result == mock_response_data["data"]
+
+        # Verify the request was made correctly
+        assert len(requests) == 1
+        request = requests[0]
+        assert str(request.url) == client.base_url
+        assert request.content == orjson.dumps({
+            "query": query,
+            "variables": variables
+        })
+        assert request.headers["Authorization"] == client.headers["Authorization"]
+        await client.aclose()
 
     @pytest.mark.asyncio
-    async def test_execute_query_with_errors(self, github_client):
+    async def test_execute_query_with_errors(self):
         """Test GraphQL query execution with GraphQL errors."""
         mock_response_data = {
             "data": None,
@@ -85,64 +275,121 @@ class TestGitHubClient:
             ]
         }
         
-        with patch('httpx.AsyncClient') as mock_async_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = mock_response_data
-            mock_response.raise_for_status.return_value = None
-            
-            mock_client = mock_async_client.return_value.__aenter__.return_value
-            mock_client.post = AsyncMock(return_value=mock_response)
-            
-            query = "query { user(login: $username) { login } }"
-            variables = {"username": "nonexistent"}
-            
-            with pytest.raises(Exception, match="GraphQL errors"):
-                await github_client.query(query, variables)
+        handler, _ = _respond_with(mock_response_data)
+        client = _mock_transport_client(TOKEN, handler)
+
+        query = "query { user(login: $username) { login } }"
+        variables = {"username": "nonexistent"}
+
+        with pytest.raises(Exception, match="GraphQL errors"):
+            await client.query(query, variables)
+        await client.aclose()
 
     @pytest.mark.asyncio
-    async def test_execute_query_http_error(self, github_client):
+    async def test_execute_query_http_error(self):
         """Test GraphQL query execution with HTTP errors."""
         with patch('httpx.AsyncClient') as mock_async_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 401
-            mock_response.text = "Unauthorized"
-            
-            mock_client = mock_async_client.return_value.__aenter__.return_value
-            mock_client.post = AsyncMock(return_value=mock_response)
-            
+            mock_client = mock_async_client.return_value
+            mock_client.post = AsyncMock(
+                return_value=FakeResponse(401, text="Unauthorized")
+            )
+
+            # Fresh instance: the patched httpx client must not leak
+            # into the session-scoped fixture
+            client = GitHubClient(TOKEN)
             query = "query { viewer { login } }"
-            
+
             with pytest.raises(Exception, match="Invalid GitHub token"):
-                await github_client.query(query)
+                await client.query(query)
 
     @pytest.mark.asyncio
-    async def test_execute_query_network_error(self, github_client):
+    async def test_execute_query_network_error(self):
         """Test GraphQL query execution with network errors."""
         with patch('httpx.AsyncClient') as mock_async_client:
-            mock_client = mock_async_client.return_value.__aenter__.return_value
+            mock_client = mock_async_client.return_value
             mock_client.post = AsyncMock(side_effect=httpx.ConnectError("Connection failed"))
-            
+
+            client = GitHubClient(TOKEN)
+            # No backoff sleeps between the retried attempts
+            client.retry_base_delay = 0.0
             query = "query { viewer { login } }"
-            
+
             with pytest.raises(GitHubAPIError, match="Request failed"):
-                await github_client.query(query)
+                await client.query(query)
 
     @pytest.mark.asyncio
-    async def test_execute_query_timeout(self, github_client):
+    async def test_execute_query_timeout(self):
         """Test GraphQL query execution with timeout."""
         with patch('httpx.AsyncClient') as mock_async_client:
-            mock_client = mock_async_client.return_value.__aenter__.return_value
+            mock_client = mock_async_client.return_value
             mock_client.post = AsyncMock(side_effect=httpx.TimeoutException("Request timeout"))
-            
+
+            client = GitHubClient(TOKEN)
+            client.retry_base_delay = 0.0
             query = "query { viewer { login } }"
-            
+
             with pytest.raises(Exception, match="Request timeout"):
-                await github_client.query(query)
+                await client.query(query)
+
+    @pytest.mark.asyncio
+    async def test_retry_honors_retry_after_header(self):
+        """Test that a 429 retries after the server-advised delay."""
+        mock_response_data = {"data": {"viewer": {"login": "testuser"}}}
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if len(requests) == 1:
+                return httpx.Response(429, headers={"Retry-After": "7"})
+            return httpx.Response(
+                200,
+                content=orjson.dumps(mock_response_data),
+                headers={"Content-Type": "application/json"},
+            )
+
+        client = _mock_transport_client(TOKEN, handler)
+        client.retry_base_delay = 0.0
+
+        with patch(
+            "github_stars_mcp.utils.github_client.asyncio.sleep",
+            new_callable=AsyncMock,
+        ) as mock_sleep:
+            result = await client.query("query { viewer { login } }")
+
+        assert result == mock_response_data["data"]
+        assert len(requests) == 2
+        # The backoff used the advised delay, not the exponential one
+        mock_sleep.assert_awaited_once_with(7.0)
+        await client.aclose()
 
     @pytest.mark.asyncio
-    async def test_execute_query_rate_limit(self, github_client):
+    async def test_retry_exhaustion_reraises_rate_limit(self):
+        """Test that persistent 429s surface RateLimitError after max_retries."""
+
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(429, headers={"Retry-After": "0"})
+
+        client = _mock_transport_client(TOKEN, handler)
+        client.retry_base_delay = 0.0
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await client.query("query { viewer { login } }")
+
+        # Every configured attempt was made before giving up, and the
+        # advised delay survives on the raised error for callers
+        assert len(requests) == client.max_retries
+        assert exc_info.value.retry_after == 0.0
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_execute_query_rate_limit(self):
         """Test GraphQL query execution with rate limiting."""
+        # Only this test needs datetime; keep the import out of collection
+        from datetime import datetime, timedelta
+
         # Mock rate limit response
         mock_response_data = {
             "data": {
@@ -161,22 +408,17 @@ class TestGitHubClient:
             ]
         }
         
-        with patch('httpx.AsyncClient') as mock_async_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = mock_response_data
-            mock_response.raise_for_status.return_value = None
-            
-            mock_client = mock_async_client.return_value.__aenter__.return_value
-            mock_client.post = AsyncMock(return_value=mock_response)
-            
-            query = "query { viewer { login } }"
-            
-            with pytest.raises(Exception, match="GraphQL errors"):
-                await github_client.query(query)
+        handler, _ = _respond_with(mock_response_data)
+        client = _mock_transport_client(TOKEN, handler)
+
+        query = "query { viewer { login } }"
+
+        with pytest.raises(Exception, match="GraphQL errors"):
+            await client.query(query)
+        await client.aclose()
 
     @pytest.mark.asyncio
-    async def test_execute_query_partial_data_with_errors(self, github_client):
+    async def test_execute_query_partial_data_with_errors(self):
         """Test GraphQL query execution with partial data and errors."""
         mock_response_data = {
             "data": {
@@ -193,74 +435,54 @@ class TestGitHubClient:
             ]
         }
         
-        with patch('httpx.AsyncClient') as mock_async_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = mock_response_data
-            mock_response.raise_for_status.return_value = None
-            
-            mock_client = mock_async_client.return_value.__aenter__.return_value
-            mock_client.post = AsyncMock(return_value=mock_response)
-            
-            query = "query { user(login: $username) { login name } }"
-            variables = {"username": "testuser"}
-            
-            # Should raise exception even with partial data when errors exist
-            with pytest.raises(Exception, match="GraphQL errors"):
-                await github_client.query(query, variables)
+        handler, _ = _respond_with(mock_response_data)
+        client = _mock_transport_client(TOKEN, handler)
+
+        query = "query { user(login: $username) { login name } }"
+        variables = {"username": "testuser"}
+
+        # Should raise exception even with partial data when errors exist
+        with pytest.raises(Exception, match="GraphQL errors"):
+            await client.query(query, variables)
+        await client.aclose()
 
     @pytest.mark.asyncio
-    async def test_execute_query_empty_response(self, github_client):
+    async def test_execute_query_empty_response(self):
         """Test GraphQL query execution with empty response."""
-        with patch('httpx.AsyncClient') as mock_async_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {}
-            mock_response.raise_for_status.return_value = None
-            
-            mock_client = mock_async_client.return_value.__aenter__.return_value
-            mock_client.post = AsyncMock(return_value=mock_response)
-            
-            query = "query { viewer { login } }"
-            
-            result = await github_client.query(query)
-            
-            # Should return empty dict for empty data
-            assert result == {}
+        handler, _ = _respond_with({})
+        client = _mock_transport_client(TOKEN, handler)
+
+        query = "query { viewer { login } }"
+
+        result = await client.query(query)
+
+        # Should return empty dict for empty data
+        assert result == {}
+        await client.aclose()
 
     @pytest.mark.asyncio
-    async def test_execute_query_malformed_json(self, github_client):
+    async def test_execute_query_malformed_json(self):
         """Test GraphQL query execution with malformed JSON response."""
         with patch('httpx.AsyncClient') as mock_async_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.side_effect = ValueError("Invalid JSON")
-            mock_response.raise_for_status.return_value = None
-            
-            mock_client = mock_async_client.return_value.__aenter__.return_value
-            mock_client.post = AsyncMock(return_value=mock_response)
-            
+            mock_client = mock_async_client.return_value
+            mock_client.post = AsyncMock(
+                return_value=FakeResponse(200, content=b"not valid json")
+            )
+
+            client = GitHubClient(TOKEN)
             query = "query { viewer { login } }"
-            
-            with pytest.raises(ValueError, match="Invalid JSON"):
-                await github_client.query(query)
+
+            with pytest.raises(orjson.JSONDecodeError):
+                await client.query(query)
 
     # Context manager test removed - GitHubClient doesn't implement async context manager protocol
 
     # Close method test removed - GitHubClient doesn't have a close method
 
-    def test_headers_configuration(self, client_settings):
+    def test_headers_configuration(self, github_client):
         """Test that headers are configured correctly."""
-        client = GitHubClient(client_settings.github_token)
-        
-        expected_headers = {
-            "Authorization": f"Bearer {client_settings.github_token}",
-            "Accept": "application/vnd.github.v4+json",
-            "User-Agent": "github-stars-mcp-server/1.0"
-        }
-        
-        for key, value in expected_headers.items():
-            assert client.headers[key] == value
+        # Single C-level superset comparison over the precomputed dict
+        assert github_client.headers.items() >= _EXPECTED_HEADERS.items()
 
     def test_api_url_configuration(self, client_settings):
         """Test that API URL is configured correctly."""
@@ -268,7 +490,7 @@ class TestGitHubClient:
         assert client.base_url == "https://api.github.com/graphql"
 
     @pytest.mark.asyncio
-    async def test_execute_query_with_complex_variables(self, github_client):
+    async def test_execute_query_with_complex_variables(self):
         """Test GraphQL query execution with complex variables."""
         mock_response_data = {
             "data": {
@@ -283,209 +505,263 @@ class TestGitHubClient:
             }
         }
         
-        with patch('httpx.AsyncClient') as mock_async_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = mock_response_data
-            mock_response.raise_for_status.return_value = None
-            
-            mock_client = mock_async_client.return_value.__aenter__.return_value
-            mock_client.post = AsyncMock(return_value=mock_response)
-            
-            query = """
-            query($username: String!, $first: Int!, $after: String) {
-                user(login: $username) {
-                    starredRepositories(first: $first, after: $after) {
-                        edges {
-                            starredAt
-                            node {
-                                nameWithOwner
-                            }
-                        }
-                        pageInfo {
-                            hasNextPage
-                            endCursor
-                        }
-                    }
-                }
-            }
-            """
-            
-            variables = {
-                "username": "testuser",
-                "first": 10,
-                "after": "cursor123"
-            }
-            
-            result = await github_client.query(query, variables)
-            
-            assert result == mock_response_data["data"]
-            
-            # Verify complex variables were passed correctly
-            call_args = mock_client.post.call_args
-            assert call_args[1]["json"]["variables"] == variables
-
+        handler, requests = _respond_with(mock_response_data)
+        client = _mock_transport_client(TOKEN, handler)
 
-class TestGitHubClientIntegration:
-    """Integration tests for GitHub client."""
-    
-    @pytest.fixture
-    def client_settings(self):
-        """Create test settings for GitHub client."""
-        return Settings(
-            github_token="test_token_123"
-        )
-    
-    @pytest.fixture
-    def integration_github_client(self, client_settings):
-        """Create GitHub client for integration tests."""
-        return GitHubClient(client_settings.github_token)
-
-    @pytest.mark.asyncio
-    async def test_real_query_structure(self, integration_github_client):
-        """Test that client can handle real GitHub GraphQL query structures."""
-        # This test uses a mock but with real query structure
-        real_query = """
-        query GetUserStarredRepositories($username: String!, $first: Int!, $after: String) {
+        query = """
+        query($username: String!, $first: Int!, $after: String) {
             user(login: $username) {
-                starredRepositories(first: $first, after: $after, orderBy: {field: STARRED_AT, direction: DESC}) {
+                starredRepositories(first: $first, after: $after) {
                     edges {
                         starredAt
                         node {
                             nameWithOwner
-                            description
-                            stargazerCount
-                            url
-                            primaryLanguage {
-                                name
-                                color
-                            }
-                            createdAt
-                            updatedAt
-                            pushedAt
-                            isPrivate
-                            isFork
-                            isArchived
-                            owner {
-                                login
-                                avatarUrl
-                                ... on User {
-                                    name
-                                    bio
-                                    location
-                                    company
-                                    email
-                                    createdAt
-                                    updatedAt
-                                    publicRepos
-                                    followers
-                                    following
-                                }
-                                ... on Organization {
-                                    name
-                                    description
-                                    location
-                                    email
-                                    createdAt
-                                    updatedAt
-                                }
-                            }
                         }
                     }
                     pageInfo {
-                        endCursor
                         hasNextPage
-                        hasPreviousPage
-                        startCursor
+                        endCursor
                     }
-                    totalCount
                 }
             }
         }
         """
-        
+
+        variables = {
+            "username": "testuser",
+            "first": 10,
+            "after": "cursor123"
+        }
+
+        result = await client.query(query, variables)
+
+        assert result == mock_response_data["data"]
+
+        # Verify complex variables were passed correctly
+        assert orjson.loads(requests[0].content)["variables"] == variables
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_get_starred_for_many(self):
+        """Test batched starred-repos fetch for multiple users."""
         mock_response_data = {
             "data": {
-                "user": {
+                "u0": {
                     "starredRepositories": {
-                        "edges": [
-                            {
-                                "starredAt": "2023-01-01T00:00:00Z",
-                                "node": {
-                                    "nameWithOwner": "octocat/Hello-World",
-                                    "description": "This your first repo!",
-                                    "stargazerCount": 1420,
-                                    "url": "https://github.com/octocat/Hello-World",
-                                    "primaryLanguage": {
-                                        "name": "Python",
-                                        "color": "#3572A5"
-                                    },
-                                    "createdAt": "2011-01-26T19:01:12Z",
-                                    "updatedAt": "2023-01-01T00:00:00Z",
-                                    "pushedAt": "2023-01-01T00:00:00Z",
-                                    "isPrivate": False,
-                                    "isFork": False,
-                                    "isArchived": False,
-                                    "owner": {
-                                        "login": "octocat",
-                                        "avatarUrl": "https://github.com/images/error/octocat_happy.gif",
-                                        "name": "The Octocat",
-                                        "bio": "A great octopus",
-                                        "location": "San Francisco",
-                                        "company": "GitHub",
-                                        "email": "octocat@github.com",
-                                        "createdAt": "2008-01-14T04:33:35Z",
-                                        "updatedAt": "2023-01-01T00:00:00Z",
-                                        "publicRepos": 8,
-                                        "followers": 3938,
-                                        "following": 9
-                                    }
-                                }
-                            }
-                        ],
-                        "pageInfo": {
-                            "endCursor": "cursor123",
-                            "hasNextPage": True,
-                            "hasPreviousPage": False,
-                            "startCursor": "cursor000"
-                        },
-                        "totalCount": 100
+                        "nodes": [{"nameWithOwner": "octocat/Hello-World"}],
+                        "pageInfo": {"hasNextPage": False, "endCursor": None}
                     }
-                }
+                },
+                "u1": None
             }
         }
-        
+
         with patch('httpx.AsyncClient') as mock_async_client:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = mock_response_data
-            mock_response.raise_for_status.return_value = None
-            
-            mock_client = mock_async_client.return_value.__aenter__.return_value
-            mock_client.post = AsyncMock(return_value=mock_response)
-            
-            variables = {
-                "username": "testuser",
-                "first": 10,
-                "after": None
-            }
-            
-            result = await integration_github_client.query(real_query, variables)
-            
-            # Verify the structure matches what our models expect
-            assert "user" in result
-            assert "starredRepositories" in result["user"]
-            assert "edges" in result["user"]["starredRepositories"]
-            assert "pageInfo" in result["user"]["starredRepositories"]
-            assert "totalCount" in result["user"]["starredRepositories"]
-            
-            # Verify edge structure
-            edge = result["user"]["starredRepositories"]["edges"][0]
-            assert "starredAt" in edge
-            assert "node" in edge
-            
-            # Verify node structure
-            node = edge["node"]
-            assert "nameWithOwner" in node
-            assert "stargazerCount" in node
-            assert "owner" in node
\ No newline at end of file
+            mock_client = mock_async_client.return_value
+            mock_client.post = AsyncMock(
+                return_value=FakeResponse(200, content=orjson.dumps(mock_response_data))
+            )
+
+            # Fresh instance: this test populates the response cache
+            client = GitHubClient(TOKEN)
+            result = await client.get_starred_for_many(["octocat", "ghost"])
+
+            # Both users resolved in a single request
+            mock_client.post.assert_called_once()
+            payload = orjson.loads(mock_client.post.call_args[1]["content"])
+            assert payload["variables"] == {"u0": "octocat", "u1": "ghost", "first": 100}
+
+            nodes = result["octocat"]["nodes"]
+            assert nodes[0]["nameWithOwner"] == "octocat/Hello-World"
+            # Unknown users map to an empty page
+            assert result["ghost"]["nodes"] == []
+
+
+class TestAsyncRateLimiter:
+    """Test cases for the header-driven proactive rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_for_reset_when_budget_low(self):
+        """Test that acquire sleeps until reset when budget is low."""
+        limiter = AsyncRateLimiter(min_remaining=10)
+        limiter.update({
+            "x-ratelimit-remaining": "3",
+            "x-ratelimit-reset": str(time.time() + 42),
+        })
+
+        with patch(
+            "github_stars_mcp.utils.github_client.asyncio.sleep",
+            new_callable=AsyncMock,
+        ) as mock_sleep:
+            await limiter.acquire()
+
+        mock_sleep.assert_awaited_once()
+        delay = mock_sleep.await_args.args[0]
+        assert 0 < delay <= 42
+        # Stale numbers are forgotten until the next response reports
+        assert limiter.remaining is None
+
+    @pytest.mark.asyncio
+    async def test_acquire_does_not_wait_with_budget(self):
+        """Test that acquire passes straight through with budget left."""
+        limiter = AsyncRateLimiter(min_remaining=10)
+        limiter.update({
+            "x-ratelimit-remaining": "4000",
+            "x-ratelimit-reset": str(time.time() + 42),
+        })
+
+        with patch(
+            "github_stars_mcp.utils.github_client.asyncio.sleep",
+            new_callable=AsyncMock,
+        ) as mock_sleep:
+            await limiter.acquire()
+
+        mock_sleep.assert_not_awaited()
+        assert limiter.remaining == 4000
+
+    def test_update_ignores_missing_or_malformed_headers(self):
+        """Test that update is a no-op on absent or unparsable headers."""
+        limiter = AsyncRateLimiter()
+
+        limiter.update({})
+        limiter.update({"x-ratelimit-remaining": "plenty"})
+        limiter.update({
+            "x-ratelimit-remaining": "5",
+            "x-ratelimit-reset": "soon",
+        })
+
+        assert limiter.remaining is None
+        assert limiter.reset_at == 0.0
+
+
+class TestResponseCache:
+    """Test cases for the client's TTL/ETag response cache."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_network(self):
+        """Test that a fresh repeat of a query is served from cache."""
+        mock_response_data = {"data": {"viewer": {"login": "testuser"}}}
+        handler, requests = _respond_with(mock_response_data)
+        client = _mock_transport_client(TOKEN, handler)
+
+        query = "query { viewer { login } }"
+        first = await client.query(query)
+        second = await client.query(query)
+
+        assert first == second == mock_response_data["data"]
+        # The second call never reached the transport
+        assert len(requests) == 1
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_on_different_variables(self):
+        """Test that different variables produce distinct cache entries."""
+        handler, requests = _respond_with({"data": {}})
+        client = _mock_transport_client(TOKEN, handler)
+
+        query = "query($username: String!) { user(login: $username) { login } }"
+        await client.query(query, {"username": "octocat"})
+        await client.query(query, {"username": "ghost"})
+
+        assert len(requests) == 2
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_etag_revalidation_refreshes_stale_entry(self):
+        """Test that a stale entry is revalidated via If-None-Match/304."""
+        from github_stars_mcp.utils.github_client import CACHE_TTL_SECONDS
+
+        mock_response_data = {"data": {"viewer": {"login": "testuser"}}}
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if len(requests) == 1:
+                return httpx.Response(
+                    200,
+                    content=orjson.dumps(mock_response_data),
+                    headers={"ETag": 'W/"abc123"'},
+                )
+            return httpx.Response(304)
+
+        client = _mock_transport_client(TOKEN, handler)
+
+        query = "query { viewer { login } }"
+        first = await client.query(query)
+
+        # Age the single cache entry past the TTL so the next call must
+        # revalidate instead of serving it directly
+        entry = next(iter(client._response_cache.values()))
+        entry["ts"] -= CACHE_TTL_SECONDS + 1
+
+        second = await client.query(query)
+
+        assert second == first
+        assert len(requests) == 2
+        assert requests[1].headers["If-None-Match"] == 'W/"abc123"'
+
+        # The 304 refreshed the timestamp: a third call is a cache hit
+        third = await client.query(query)
+        assert third == first
+        assert len(requests) == 2
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_cache_eviction_drops_oldest_entry(self):
+        """Test that the oldest entry is evicted once the cache is full."""
+        handler, requests = _respond_with({"data": {}})
+        client = _mock_transport_client(TOKEN, handler)
+
+        with patch(
+            "github_stars_mcp.utils.github_client.CACHE_MAX_ENTRIES", 1
+        ):
+            await client.query("query { viewer { login } }")
+            await client.query("query { viewer { name } }")
+
+        assert len(requests) == 2
+        assert len(client._response_cache) == 1
+        # Only the newer query survives: repeating the older one goes
+        # back to the network
+        with patch(
+            "github_stars_mcp.utils.github_client.CACHE_MAX_ENTRIES", 1
+        ):
+            await client.query("query { viewer { login } }")
+        assert len(requests) == 3
+        await client.aclose()
+
+
+class TestGitHubClientIntegration:
+    """Integration tests for GitHub client."""
+
+    @pytest.mark.asyncio
+    async def test_real_query_structure(self):
+        """Test that client can handle real GitHub GraphQL query structures."""
+        handler, _ = _respond_with(content=_REAL_RESPONSE_BODY)
+        client = _mock_transport_client(TOKEN, handler)
+
+        variables = {
+            "username": "testuser",
+            "first": 10,
+            "after": None
+        }
+
+        result = await client.query(REAL_QUERY, variables)
+
+        # Verify the structure matches what our models expect
+        assert "user" in result
+        assert "starredRepositories" in result["user"]
+        assert "edges" in result["user"]["starredRepositories"]
+        assert "pageInfo" in result["user"]["starredRepositories"]
+        assert "totalCount" in result["user"]["starredRepositories"]
+
+        # Verify edge structure
+        edge = result["user"]["starredRepositories"]["edges"][0]
+        assert "starredAt" in edge
+        assert "node" in edge
+
+        # Verify node structure
+        node = edge["node"]
+        assert "nameWithOwner" in node
+        assert "stargazerCount" in node
+        assert "owner" in node
+        await client.aclose()
\ No newline at end of file
@@ -2,10 +2,14 @@
 
 import pytest
 import asyncio
+import statistics
 import time
+import tracemalloc
 import os
 import sys
-from unittest.mock import AsyncMock, patch
+from functools import lru_cache
+from itertools import chain
+from unittest.mock import patch
 from concurrent.futures import ThreadPoolExecutor
 
 try:
@@ -15,6 +19,10 @@ except ImportError:
     HAS_PSUTIL = False
     psutil = None
 
+from github_stars_mcp.utils.github_client import (
+    GitHubClient,
+    STARRED_BATCH_MAX_ALIASES,
+)
 from github_stars_mcp.tools.starred_repo_list import get_user_starred_repositories
 from github_stars_mcp.tools.repo_details import get_repo_details
 from github_stars_mcp.tools.batch_repo_details import get_batch_repo_details
@@ -26,42 +34,166 @@ from github_stars_mcp.models import (
     RepositoryDetails
 )
 
+# One Process handle for the whole module; creating it per test re-reads
+# /proc each time, and oneshot() below batches the remaining reads.
+_PROC = psutil.Process(os.getpid()) if HAS_PSUTIL else None
 
-class TestPerformance:
-    """Performance tests for MCP tools."""
 
-    @pytest.fixture
-    def mock_context(self):
-        """Create a mock FastMCP context for testing."""
-        context = AsyncMock()
-        context.info = AsyncMock()
-        context.error = AsyncMock()
-        context.debug = AsyncMock()
-        return context
+class _NullContext:
+    """No-op FastMCP context stand-in.
 
-    @pytest.fixture
-    def large_repository_list(self):
-        """Create a large list of repositories for testing."""
-        return [f"user/repo{i}" for i in range(1000)]
+    AsyncMock pays attribute-interception and call-recording costs on
+    every ctx.info(...) in the hot loops; no test here asserts on the
+    context, so plain no-op coroutines suffice.
+    """
+
+    __slots__ = ()
+
+    async def info(self, *args, **kwargs):
+        pass
+
+    async def debug(self, *args, **kwargs):
+        pass
+
+    async def warning(self, *args, **kwargs):
+        pass
+
+    async def error(self, *args, **kwargs):
+        pass
+
+
+_NULL_CONTEXT = _NullContext()
+
+
+# One ~8KB readme string shared by every mock detail instead of a fresh
+# multiply per repo (500+ allocations across the memory/batch tests).
+_BIG_README = "# Large README\n" + "Content " * 1000
+
+
+@lru_cache(maxsize=8)
+def _mock_starred_page(count: int, offset: int = 0, has_next: bool = False,
+                       cursor: str = "", total: int | None = None) -> dict:
+    """Build (and memoize) one GraphQL starred-repositories page.
+
+    The same edges/totalCount/pageInfo shape is rebuilt by several
+    tests; caching by parameters hands every call the one instance.
+    """
+    return {
+        "edges": [
+            {"node": {
+                "id": f"repo{i + offset}",
+                "nameWithOwner": f"user/repo{i + offset}",
+                "name": f"repo{i + offset}",
+                "owner": {"login": "user"},
+                "stargazerCount": 100 + i + offset,
+                "url": f"https://github.com/user/repo{i + offset}"
+            }}
+            for i in range(count)
+        ],
+        "totalCount": total if total is not None else count,
+        "pageInfo": {"hasNextPage": has_next, "endCursor": cursor}
+    }
+
+
+async def _warmup(coro_factory, rounds: int = 3) -> None:
+    """Discarded calls that absorb one-shot costs before timing.
+
+    Lazy imports, validator compilation and mock setup all land on the
+    first call; running a few throwaway rounds keeps them out of the
+    measured window so thresholds can stay tight.
+    """
+    for _ in range(rounds):
+        await coro_factory()
+
+
+async def _median_time(coro_factory, rounds: int = 5) -> float:
+    """Median wall time of repeated calls to coro_factory.
+
+    A single perf_counter bracket is dominated by whatever the OS
+    scheduler did that instant; the median over a few rounds is stable
+    enough to assert against.
+    """
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await coro_factory()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+async def _max_loop_stall(stop: asyncio.Event, interval: float = 0.01) -> float:
+    """Sample event-loop responsiveness until `stop` is set.
+
+    Returns the worst observed scheduling delay beyond the requested
+    sleep interval — a direct measure of how long something blocked the
+    loop thread.
+    """
+    loop = asyncio.get_running_loop()
+    max_stall = 0.0
+    last = loop.time()
+    while not stop.is_set():
+        await asyncio.sleep(interval)
+        now = loop.time()
+        max_stall = max(max_stall, now - last - interval)
+        last = now
+    return max_stall
+
+
+async def _bounded_gather(coros, limit: int, return_exceptions: bool = False):
+    """Fan out coroutines while capping concurrency at `limit`.
+
+    Mirrors how a real client would throttle against API rate limits
+    instead of firing an unbounded asyncio.gather.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(
+        *(run(coro) for coro in coros), return_exceptions=return_exceptions
+    )
+
+
+# For tests that never look at per-repo fields, one frozen detail can
+# back every dict entry via dict.fromkeys — no per-entry constructor.
+_SHARED_DETAIL = RepositoryDetails.model_construct(
+    readme_content=_BIG_README,
+    description="Shared description",
+    topics=["python", "test", "performance"],
+    languages=["Python", "JavaScript"]
+)
+
+
+@lru_cache(maxsize=1024)
+def _make_repo_details(repo_id: str) -> RepositoryDetails:
+    """Build (and memoize) one mock detail per repo id.
+
+    Repo ids overlap between the batch and memory tests, so the cache
+    also skips re-running the pydantic constructor across tests.
+    """
+    # Test-only, inputs are trusted; skip the validator chain
+    return RepositoryDetails.model_construct(
+        readme_content=_BIG_README,
+        description=f"Description for {repo_id}",
+        topics=["python", "test"],
+        languages=["Python"]
+    )
+
+
+@pytest.mark.xdist_group("performance")
+class TestPerformance:
+    """Performance tests for MCP tools.
+
+    Grouped onto one xdist worker so in-process measurements
+    (tracemalloc, RSS) are not skewed by sibling tests.
+    """
 
     @pytest.fixture
-    def mock_starred_response_large(self):
-        """Create a large mock starred repositories response."""
-        return StarredRepositoriesResponse(
-            repositories=[
-                StartedRepository(
-                    id=f"repo{i}",
-                    nameWithOwner=f"user/repo{i}",
-                    name=f"repo{i}",
-                    owner="user",
-                    stargazerCount=100 + i,
-                    url=f"https://github.com/user/repo{i}"
-                ) for i in range(1000)
-            ],
-            total_count=1000,
-            has_next_page=False,
-            end_cursor=""
-        )
+    def mock_context(self):
+        """Provide the shared no-op FastMCP context."""
+        return _NULL_CONTEXT
 
     @pytest.mark.asyncio
     @pytest.mark.performance
@@ -72,62 +204,63 @@ class TestPerformance:
              patch('github_stars_mcp.tools.starred_repo_list.validate_github_username') as mock_validate:
             
             mock_validate.return_value = "testuser"
-            mock_request.return_value = {
-                "edges": [{"node": {"id": f"repo{i}", "nameWithOwner": f"user/repo{i}"}} for i in range(100)],
-                "totalCount": 100,
-                "pageInfo": {"hasNextPage": False, "endCursor": ""}
-            }
-            
-            # Measure response time
-            start_time = time.perf_counter()
-            result = await get_user_starred_repositories(mock_context, "testuser")
-            end_time = time.perf_counter()
-            
-            response_time = end_time - start_time
-            
-            # Should complete within reasonable time (< 1 second for mocked response)
-            assert response_time < 1.0
-            assert len(result.repositories) == 100
-            
-            print(f"Starred repositories response time: {response_time:.4f} seconds")
+            mock_request.return_value = _mock_starred_page(100)
+
+            # Measure the median response time over several rounds
+            results = []
+
+            async def call():
+                results.append(
+                    await get_user_starred_repositories(mock_context, "testuser")
+                )
+
+            await _warmup(call)
+            response_time = await _median_time(call)
+
+            # Mocked responses should be fast once warm
+            assert response_time < 0.1
+            assert len(results[-1].repositories) == 100
+
+            print(f"Starred repositories median response time: {response_time:.4f} seconds")
 
     @pytest.mark.asyncio
     @pytest.mark.performance
-    async def test_batch_processing_performance(self, mock_context, large_repository_list):
-        """Test performance of batch repository processing."""
-        # Limit to 100 repos for performance test
-        repo_list = large_repository_list[:100]
-        
-        mock_response = BatchRepositoryDetailsResponse(data={
-            repo_id: RepositoryDetails(
-                readme_content=f"# {repo_id}\nThis is a test repository.",
-                description=f"Description for {repo_id}",
-                topics=["python", "test"],
-                languages=["Python"]
-            ) for repo_id in repo_list
-        })
-        
+    @pytest.mark.parametrize("batch_size", [16, 32, 64, 100])
+    async def test_batch_processing_performance(self, mock_context, large_repository_list, batch_size):
+        """Test performance of batch repository processing.
+
+        Swept over batch sizes (the tool caps a call at 100 repos) to
+        characterize throughput rather than sampling a single point.
+        """
+        repo_list = large_repository_list[:batch_size]
+
+        mock_response = BatchRepositoryDetailsResponse.model_construct(
+            data=dict(zip(repo_list, map(_make_repo_details, repo_list), strict=True))
+        )
+
         with patch('github_stars_mcp.tools.batch_repo_details.ensure_github_client'), \
              patch('github_stars_mcp.tools.batch_repo_details.fetch_multi_repository_details') as mock_fetch:
-            
+
             mock_fetch.return_value = mock_response
-            
+
+            await _warmup(lambda: get_batch_repo_details(mock_context, repo_list))
+
             # Measure processing time
             start_time = time.perf_counter()
             result = await get_batch_repo_details(mock_context, repo_list)
             end_time = time.perf_counter()
-            
+
             processing_time = end_time - start_time
-            
-            # Should process 100 repos within reasonable time
-            assert processing_time < 5.0  # 5 seconds max
-            assert len(result.data) == 100
-            
+
+            # Should process the batch within reasonable time once warm
+            assert processing_time < 1.0
+            assert len(result.data) == batch_size
+
             # Calculate throughput
             throughput = len(repo_list) / processing_time
-            print(f"Batch processing time: {processing_time:.4f} seconds")
+            print(f"Batch size {batch_size} processing time: {processing_time:.4f} seconds")
             print(f"Throughput: {throughput:.2f} repos/second")
-            
+
             # Should achieve reasonable throughput
             assert throughput > 20  # At least 20 repos per second
 
@@ -140,24 +273,25 @@ class TestPerformance:
              patch('github_stars_mcp.tools.starred_repo_list.validate_github_username') as mock_validate:
             
             mock_validate.return_value = "testuser"
-            mock_request.return_value = {
-                "edges": [{"node": {"id": f"repo{i}", "nameWithOwner": f"user/repo{i}"}} for i in range(10)],
-                "totalCount": 10,
-                "pageInfo": {"hasNextPage": False, "endCursor": ""}
-            }
-            
+            mock_request.return_value = _mock_starred_page(10)
+
             # Create multiple concurrent requests
             num_concurrent = 10
-            
+
             start_time = time.perf_counter()
-            
-            tasks = [
-                get_user_starred_repositories(mock_context, f"user{i}")
-                for i in range(num_concurrent)
-            ]
-            
-            results = await asyncio.gather(*tasks)
-            
+
+            # TaskGroup skips gather's wrapper future and cancels
+            # siblings on the first error (requires-python is >=3.11)
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(
+                        get_user_starred_repositories(mock_context, f"user{i}")
+                    )
+                    for i in range(num_concurrent)
+                ]
+
+            results = [task.result() for task in tasks]
+
             end_time = time.perf_counter()
             total_time = end_time - start_time
             
@@ -176,59 +310,82 @@ class TestPerformance:
 
     @pytest.mark.asyncio
     @pytest.mark.performance
-    @pytest.mark.skipif(not HAS_PSUTIL, reason="psutil not available")
     async def test_memory_usage_monitoring(self, mock_context):
         """Test memory usage during operations."""
-        process = psutil.Process(os.getpid())
-        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
-        
-        # Create large mock data
+        initial_memory = 0.0  # MB
+        if _PROC is not None:
+            with _PROC.oneshot():
+                initial_memory = _PROC.memory_info().rss / 1024 / 1024
+
+        # Create large mock data; the tool caps a call at 100 repos, so
+        # feed it 100-repo chunks and aggregate
         large_repo_list = [f"user/repo{i}" for i in range(500)]
-        
-        mock_response = BatchRepositoryDetailsResponse(data={
-            repo_id: RepositoryDetails(
-                readme_content="# Large README\n" + "Content " * 1000,  # ~7KB per repo
-                description=f"Description for {repo_id}",
-                topics=["python", "test", "performance"],
-                languages=["Python", "JavaScript"]
-            ) for repo_id in large_repo_list
-        })
-        
+        chunks = [large_repo_list[i:i + 100] for i in range(0, 500, 100)]
+        chunk_responses = [
+            BatchRepositoryDetailsResponse.model_construct(
+                data=dict.fromkeys(chunk, _SHARED_DETAIL)
+            )
+            for chunk in chunks
+        ]
+
         with patch('github_stars_mcp.tools.batch_repo_details.ensure_github_client'), \
              patch('github_stars_mcp.tools.batch_repo_details.fetch_multi_repository_details') as mock_fetch:
-            
-            mock_fetch.return_value = mock_response
-            
-            # Process the data
-            result = await get_batch_repo_details(mock_context, large_repo_list)
-            
-            # Measure memory after processing
-            final_memory = process.memory_info().rss / 1024 / 1024  # MB
-            memory_increase = final_memory - initial_memory
-            
-            print(f"Initial memory: {initial_memory:.2f} MB")
-            print(f"Final memory: {final_memory:.2f} MB")
-            print(f"Memory increase: {memory_increase:.2f} MB")
-            
+
+            mock_fetch.side_effect = chunk_responses
+
+            # Trace allocations around the processing; unlike RSS this
+            # is deterministic and does not need psutil
+            tracemalloc.start()
+            snapshot_before = tracemalloc.take_snapshot()
+
+            data = {}
+            for chunk in chunks:
+                result = await get_batch_repo_details(mock_context, chunk)
+                data.update(result.data)
+
+            snapshot_after = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+
+            allocation_stats = snapshot_after.compare_to(snapshot_before, "lineno")
+            traced_increase = sum(stat.size_diff for stat in allocation_stats)
+
+            print(f"Traced allocation increase: {traced_increase / 1024 / 1024:.2f} MB")
+
             # Verify processing completed successfully
-            assert len(result.data) == 500
-            
-            # Memory increase should be reasonable (less than 100MB for this test)
-            assert memory_increase < 100
+            assert len(data) == 500
+
+            # Surface the top allocators before failing on a regression
+            if traced_increase >= 20_000_000:
+                for stat in allocation_stats[:10]:
+                    print(stat)
+            assert traced_increase < 20_000_000
+
+            if _PROC is not None:
+                # Measure RSS after processing (coarse, page-granular)
+                with _PROC.oneshot():
+                    final_memory = _PROC.memory_info().rss / 1024 / 1024  # MB
+                memory_increase = final_memory - initial_memory
+
+                print(f"Initial memory: {initial_memory:.2f} MB")
+                print(f"Final memory: {final_memory:.2f} MB")
+                print(f"Memory increase: {memory_increase:.2f} MB")
+
+                # Shared readme payloads keep the footprint small
+                assert memory_increase < 20
 
     @pytest.mark.asyncio
     @pytest.mark.performance
     async def test_analysis_bundle_performance(self, mock_context):
         """Test performance of full analysis bundle creation."""
         # Mock starred repositories response
-        starred_response = StarredRepositoriesResponse(
+        starred_response = StarredRepositoriesResponse.model_construct(
             repositories=[
-                StartedRepository(
-                    id=f"repo{i}",
-                    nameWithOwner=f"user/repo{i}",
+                StartedRepository.model_construct(
+                    repo_id=f"repo{i}",
+                    name_with_owner=f"user/repo{i}",
                     name=f"repo{i}",
                     owner="user",
-                    stargazerCount=100 + i,
+                    stargazer_count=100 + i,
                     url=f"https://github.com/user/repo{i}"
                 ) for i in range(50)  # 50 repos for performance test
             ],
@@ -236,37 +393,43 @@ class TestPerformance:
             has_next_page=False,
             end_cursor=""
         )
-        
-        # Mock batch details response
-        batch_response = BatchRepositoryDetailsResponse(data={
-            f"user/repo{i}": RepositoryDetails(
+
+        # Mock batch details response, keyed by repo_id like the real
+        # batch tool so readmes attach to the bundle
+        batch_response = BatchRepositoryDetailsResponse.model_construct(data={
+            f"repo{i}": RepositoryDetails.model_construct(
                 readme_content=f"# Repository {i}\nDetailed description.",
                 description=f"Repository {i} description",
                 topics=["python", "test"],
                 languages=["Python"]
             ) for i in range(50)
         })
-        
-        with patch('github_stars_mcp.tools.analysis_bundle.get_user_starred_repositories') as mock_starred, \
-             patch('github_stars_mcp.tools.analysis_bundle.get_batch_repo_details') as mock_batch:
-            
+
+        # The bundle calls the _impl functions directly, so those are
+        # the names to patch; all mock construction stays above the
+        # timed region
+        with patch('github_stars_mcp.tools.analysis_bundle._get_user_starred_repositories_impl') as mock_starred, \
+             patch('github_stars_mcp.tools.analysis_bundle._get_batch_repo_details_impl') as mock_batch:
+
             mock_starred.return_value = starred_response
             mock_batch.return_value = batch_response
-            
-            # Measure analysis bundle creation time
+
+            # Timing brackets only the awaited bundle call
             start_time = time.perf_counter()
             result = await create_full_analysis_bundle(mock_context, "testuser")
             end_time = time.perf_counter()
-            
+
             processing_time = end_time - start_time
-            
+
             # Verify result
             assert result is not None
-            # Note: Actual result structure depends on implementation
-            # This is a placeholder test that should be updated based on actual return type
-            
+            assert result.total_count == 50
+            assert all(
+                repo.readme_content is not None for repo in result.repositories
+            )
+
             print(f"Analysis bundle creation time: {processing_time:.4f} seconds")
-            
+
             # Should complete within reasonable time
             assert processing_time < 10.0  # 10 seconds max for 50 repos
 
@@ -302,32 +465,33 @@ class TestPerformance:
             
             mock_validate.return_value = "testuser"
             
-            # Simulate multiple pages
+            # Simulate multiple pages (4 pages of 50 repos each)
             page_responses = [
-                {
-                    "edges": [{"node": {"id": f"repo{i+page*50}", "nameWithOwner": f"user/repo{i+page*50}"}} for i in range(50)],
-                    "totalCount": 200,
-                    "pageInfo": {"hasNextPage": page < 3, "endCursor": f"cursor{page}"}
-                }
-                for page in range(4)  # 4 pages of 50 repos each
+                _mock_starred_page(50, offset=page * 50, has_next=page < 3,
+                                   cursor=f"cursor{page}", total=200)
+                for page in range(4)
             ]
             
             mock_request.side_effect = page_responses
             
             # Measure pagination performance
             start_time = time.perf_counter()
-            
-            all_repos = []
+
+            # Collect per-page lists and flatten once at the end; this
+            # avoids repeated list-resize churn from extend in the loop
+            pages = []
             cursor = ""
-            
+
             for page in range(4):
                 result = await get_user_starred_repositories(mock_context, "testuser", cursor=cursor)
-                all_repos.extend(result.repositories)
+                pages.append(result.repositories)
                 cursor = result.end_cursor
-                
+
                 if not result.has_next_page:
                     break
-            
+
+            all_repos = list(chain.from_iterable(pages))
+
             end_time = time.perf_counter()
             pagination_time = end_time - start_time
             
@@ -342,8 +506,8 @@ class TestPerformance:
     @pytest.mark.performance
     async def test_data_serialization_performance(self, mock_context):
         """Test performance of data serialization/deserialization."""
-        import json
-        
+        import orjson
+
         # Create large data structure
         large_data = {
             f"user/repo{i}": {
@@ -354,14 +518,14 @@ class TestPerformance:
             } for i in range(100)
         }
         
-        # Measure serialization time
+        # Measure serialization time (orjson returns bytes)
         start_time = time.perf_counter()
-        serialized = json.dumps(large_data)
+        serialized = orjson.dumps(large_data)
         serialization_time = time.perf_counter() - start_time
-        
+
         # Measure deserialization time
         start_time = time.perf_counter()
-        deserialized = json.loads(serialized)
+        deserialized = orjson.loads(serialized)
         deserialization_time = time.perf_counter() - start_time
         
         print(f"Serialization time: {serialization_time:.4f} seconds")
@@ -373,58 +537,98 @@ class TestPerformance:
         assert deserialized == large_data
         
         # Should serialize/deserialize efficiently
-        assert serialization_time < 2.0
-        assert deserialization_time < 2.0
+        assert serialization_time < 0.3
+        assert deserialization_time < 0.3
 
+    @pytest.mark.asyncio
+    @pytest.mark.performance
+    async def test_serialization_off_loop(self, mock_context):
+        """Test that serialization in a worker thread keeps the loop live."""
+        import orjson
+
+        large_data = {
+            f"user/repo{i}": {
+                "readme_content": _BIG_README,
+                "description": f"Description for repo {i}",
+                "topics": ["python", "test", "performance", "data"],
+                "languages": ["Python", "JavaScript", "TypeScript"]
+            } for i in range(100)
+        }
 
+        # Encode off the loop thread while sampling loop latency
+        stop = asyncio.Event()
+        stall_task = asyncio.create_task(_max_loop_stall(stop))
+
+        serialized = await asyncio.to_thread(orjson.dumps, large_data)
+
+        stop.set()
+        max_stall = await stall_task
+
+        print(f"Max loop stall during encode: {max_stall * 1000:.2f} ms")
+
+        assert len(serialized) > 0
+        # Other coroutines must keep progressing during the encode
+        assert max_stall < 0.05
+
+
+@pytest.mark.xdist_group("load")
 class TestLoadTesting:
     """Load testing for MCP tools."""
 
     @pytest.fixture
     def mock_context(self):
-        """Create a mock FastMCP context for testing."""
-        context = AsyncMock()
-        context.info = AsyncMock()
-        context.error = AsyncMock()
-        context.debug = AsyncMock()
-        return context
+        """Provide the shared no-op FastMCP context."""
+        return _NULL_CONTEXT
 
     @pytest.mark.asyncio
     @pytest.mark.load
     @pytest.mark.slow
-    async def test_high_concurrency_load(self, mock_context):
+    @pytest.mark.parametrize("limit", [2, 4, 8, 16, 32])
+    async def test_high_concurrency_load(self, mock_context, limit):
         """Test system behavior under high concurrency load."""
         with patch('github_stars_mcp.tools.starred_repo_list.ensure_github_client'), \
              patch('github_stars_mcp.tools.starred_repo_list.safe_github_request') as mock_request, \
              patch('github_stars_mcp.tools.starred_repo_list.validate_github_username') as mock_validate:
             
             mock_validate.return_value = "testuser"
-            mock_request.return_value = {
-                "edges": [{"node": {"id": "repo1", "nameWithOwner": "user/repo1"}}],
-                "totalCount": 1,
-                "pageInfo": {"hasNextPage": False, "endCursor": ""}
-            }
+            mock_request.return_value = _mock_starred_page(1, offset=1)
             
             # High concurrency test
             num_concurrent = 100
-            
+
+            # Track how many wrapped calls overlap inside the semaphore;
+            # the sleep(0) yields once so overlap is observable even
+            # though the mocked tool never blocks on real I/O.
+            in_flight = 0
+            max_in_flight = 0
+
+            async def tracked(coro):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                try:
+                    await asyncio.sleep(0)
+                    return await coro
+                finally:
+                    in_flight -= 1
+
             start_time = time.perf_counter()
-            
+
             tasks = [
-                get_user_starred_repositories(mock_context, f"user{i}")
+                tracked(get_user_starred_repositories(mock_context, f"user{i}"))
                 for i in range(num_concurrent)
             ]
-            
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
+
+            results = await _bounded_gather(tasks, limit, return_exceptions=True)
+
             end_time = time.perf_counter()
             total_time = end_time - start_time
-            
+
             # Count successful vs failed requests
             successful = sum(1 for r in results if not isinstance(r, Exception))
             failed = len(results) - successful
-            
-            print(f"High concurrency load test:")
+
+            print(f"High concurrency load test (limit={limit}):")
             print(f"Total requests: {num_concurrent}")
             print(f"Successful: {successful}")
             print(f"Failed: {failed}")
@@ -434,19 +638,56 @@ class TestLoadTesting:
             # Most requests should succeed
             success_rate = successful / num_concurrent
             assert success_rate > 0.95  # 95% success rate
-            
+
+            # The semaphore capped concurrency at the limit, and with
+            # 100 eagerly submitted tasks the cap was actually reached
+            assert max_in_flight == limit
+
             # Should handle high load reasonably
             assert total_time < 30.0  # 30 seconds max
 
+    @pytest.mark.asyncio
+    @pytest.mark.load
+    async def test_batched_multiuser_query(self):
+        """Test that multi-user starred fetches share HTTP round-trips."""
+        num_users = 100
+        usernames = [f"user{i}" for i in range(num_users)]
+
+        async def fake_query(query, variables=None):
+            return {
+                alias: {
+                    "starredRepositories": {
+                        "nodes": [],
+                        "pageInfo": {"hasNextPage": False, "endCursor": None}
+                    }
+                }
+                for alias in variables if alias != "first"
+            }
+
+        client = GitHubClient("test_token_123")
+        with patch.object(
+            GitHubClient, "query", side_effect=fake_query
+        ) as mock_query:
+            start_time = time.perf_counter()
+            results = await client.get_starred_for_many(usernames)
+            total_time = time.perf_counter() - start_time
+
+        print(f"Batched multi-user fetch time: {total_time:.4f} seconds")
+
+        # Every user is answered, but the aliased batching collapses
+        # 100 logical requests into ceil(100 / 10) round-trips
+        assert len(results) == num_users
+        assert mock_query.call_count == num_users // STARRED_BATCH_MAX_ALIASES
+
     @pytest.mark.asyncio
     @pytest.mark.load
     @pytest.mark.slow
     async def test_sustained_load(self, mock_context):
         """Test system behavior under sustained load."""
         with patch('github_stars_mcp.tools.repo_details.ensure_github_client'), \
-             patch('github_stars_mcp.tools.repo_details.fetch_repository_details') as mock_fetch:
+             patch('github_stars_mcp.tools.repo_details.fetch_single_repository_details') as mock_fetch:
             
-            mock_fetch.return_value = RepositoryDetails(
+            mock_fetch.return_value = RepositoryDetails.model_construct(
                 readme_content="# Test Repository",
                 description="Test description",
                 topics=["test"],
@@ -468,8 +709,10 @@ class TestLoadTesting:
                     get_repo_details(mock_context, f"user/repo{batch}_{i}")
                     for i in range(batch_size)
                 ]
-                
-                batch_results = await asyncio.gather(*tasks, return_exceptions=True)
+
+                batch_results = await _bounded_gather(
+                    tasks, 8, return_exceptions=True
+                )
                 all_results.extend(batch_results)
                 
                 batch_time = time.perf_counter() - batch_start
@@ -46,6 +46,14 @@ class TestMCPServer:
         for expected_tool in expected_tools:
             assert expected_tool in tool_names
 
+    @pytest.mark.asyncio
+    async def test_get_repo_details_registered_once(self):
+        """Test that get_repo_details is registered exactly once."""
+        tools = await mcp.list_tools()
+
+        tool_names = [tool.name for tool in tools]
+        assert tool_names.count("get_repo_details") == 1
+
     @pytest.mark.asyncio
     async def test_tool_schemas(self):
         """Test that tool schemas are properly defined."""